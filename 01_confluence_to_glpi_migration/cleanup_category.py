@@ -1,106 +1,151 @@
-import requests
+import asyncio
+import io
+import logging
+import logging.handlers
+import queue
 import re
+import sys
 
 # Import from shared library
 from common.config.loader import load_config
-from common.clients.glpi_client import GlpiClient
+from common.clients.async_glpi_client import AsyncGlpiClient
 
-def cleanup_category():
+# Cap concurrent requests to the GLPI server during cleanup
+CLEANUP_CONCURRENCY = 16
+
+# Queue-backed logging: the event loop only enqueues records; a background
+# listener thread does the actual (buffered) stdout writes, so log I/O never
+# serializes the concurrent HTTP pipeline.
+_log_stream = io.TextIOWrapper(
+    io.BufferedWriter(sys.stdout.buffer, 64 * 1024), line_buffering=False
+)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(_log_stream)
+)
+
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+
+logger = logging.getLogger(__name__)
+logger.addHandler(_queue_handler)
+logger.setLevel(logging.INFO)
+
+# The client logs one line per deletion from inside the event loop; route
+# its records through the same queue so the hot loop never blocks on
+# terminal writes either.
+_client_logger = logging.getLogger(AsyncGlpiClient.__module__)
+_client_logger.addHandler(_queue_handler)
+_client_logger.setLevel(logging.INFO)
+
+# Matches embedded GLPI document links inside KB item content
+_DOCID_RE = re.compile(r'document\.send\.php\?docid=(\d+)')
+
+async def _cleanup_category():
     # 1. Load config from YAML
     cfg = load_config(validate=False)
-    
+
     # 2. Extract data from Dictionary
     # Map with config.yaml
     category_name = cfg.get('cleanup', {}).get('default_category')
-    
+
     # Map with common/config.yaml
     glpi_url = cfg.get('glpi', {}).get('url')
     app_token = cfg.get('glpi', {}).get('app_token')
     user_token = cfg.get('glpi', {}).get('user_token')
     verify_ssl = cfg.get('glpi', {}).get('verify_ssl', False)
 
-    print(f"--- Cleanup Script: Deleting items in '{category_name}' ---")
+    logger.info(f"--- Cleanup Script: Deleting items in '{category_name}' ---")
 
     if not category_name:
-         print("Error: Category name is empty. Check your config.yaml file.")
+         logger.error("Error: Category name is empty. Check your config.yaml file.")
          return
 
     # 3. Init Client with new variables
-    client = GlpiClient(
-        url=glpi_url, 
-        app_token=app_token, 
+    client = AsyncGlpiClient(
+        url=glpi_url,
+        app_token=app_token,
         user_token=user_token,
-        verify_ssl=verify_ssl
+        verify_ssl=verify_ssl,
+        concurrency=CLEANUP_CONCURRENCY
     )
 
     try:
-        client.init_session()
+        await client.init_session()
 
         # Switch to Root entity (ID=0) with recursive=True so all KB categories are visible
-        client.change_active_entity(0, is_recursive=True)
+        await client.change_active_entity(0, is_recursive=True)
 
-        root_id = client.get_kb_category_id(category_name)
+        root_id = await client.get_kb_category_id(category_name)
 
         if not root_id:
-            print(f"Category '{category_name}' not found.")
+            logger.error(f"Category '{category_name}' not found.")
             return
 
-        print(f"Found Category '{category_name}' ID: {root_id}")
-        
-        visited_ids = set()
+        logger.info(f"Found Category '{category_name}' ID: {root_id}")
+
+        # One bulk fetch of the whole category table, bucketed by parent,
+        # instead of one "list children of X" request per node (N+1).
+        children_map = await client.get_kb_children_map()
 
-        def cleanup_recursive(cat_id, cat_name):
+        # 1. Flatten the subtree with an explicit stack (deep Confluence
+        # hierarchies can exceed Python's recursion limit), grouping
+        # categories by depth.
+        levels = []  # depth -> [(cat_id, cat_name), ...]
+        stack = [(root_id, category_name, 0)]
+        visited_ids = set()
+        while stack:
+            cat_id, cat_name, depth = stack.pop()
             if cat_id in visited_ids:
-                return
+                continue
             visited_ids.add(cat_id)
-            
-            print(f"\nProcessing Category: {cat_name} ({cat_id})")
-            
-            # 1. Post-Order: Process Children First
-            endpoint = f"{client.url}/KnowbaseItemCategory"
-            params = {
-                "is_deleted": 0,
-                "range": "0-1000",
-                "is_recursive": 1
-            }
-            try:
-                resp = requests.get(endpoint, headers=client.headers, params=params, verify=client.verify_ssl)
-                resp.raise_for_status()
-                data = resp.json()
-                if isinstance(data, list):
-                    # Filter children by parent = cat_id
-                    children = [c for c in data if int(c.get('knowbaseitemcategories_id', 0)) == int(cat_id)]
-                    for child in children:
-                        cleanup_recursive(child.get('id'), child.get('name'))
-            except Exception as e:
-                print(f"  Error scanning children of {cat_id}: {e}")
-
-            # 2. Delete Items in current category
-            items = client.get_knowbase_items(cat_id)
+
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append((cat_id, cat_name))
+
+            for child in children_map.get(int(cat_id), []):
+                stack.append((child.get('id'), child.get('name'), depth + 1))
+
+        async def cleanup_one(cat_id, cat_name):
+            logger.debug(f"Processing Category: {cat_name} ({cat_id})")
+
+            # Delete Items in current category. The bulk listing already
+            # carries each item's 'answer', so extract embedded doc ids from
+            # it directly (no per-item GET), then fan out the deletes
+            # concurrently (client semaphore caps server load).
+            items = await client.get_knowbase_items(cat_id)
             if items:
-                print(f"  Found {len(items)} items in '{cat_name}'. Deleting...")
+                logger.debug(f"  Found {len(items)} items in '{cat_name}'. Deleting...")
+                item_ids = [item.get('id') for item in items]
+
+                all_doc_ids = set()
                 for item in items:
-                    item_id = item.get('id')
-                    
-                    full_item = client.get_item('KnowbaseItem', item_id)
-                    if full_item:
-                         content = full_item.get('answer', '')
-                         doc_ids = re.findall(r'document\.send\.php\?docid=(\d+)', content)
-                         for doc_id in set(doc_ids):
-                             client.delete_document(doc_id)
-                    
-                    client.delete_knowbase_item(item_id)
-            
-            # 3. Delete the Category Itself
+                    all_doc_ids.update(_DOCID_RE.findall(item.get('answer') or ''))
+
+                await asyncio.gather(*(client.delete_document(d) for d in all_doc_ids))
+                await asyncio.gather(*(client.delete_knowbase_item(i) for i in item_ids))
+
+            # Delete the Category Itself
             if cat_id != root_id:
-                 client.delete_kb_category(cat_id)
+                 await client.delete_kb_category(cat_id)
+
+        # 2. Post-order is preserved by emptying the deepest level first;
+        # categories within a level are independent, so fan them out.
+        logger.info("Starting Iterative Cleanup (Post-Order, deepest level first)...")
+        for depth in range(len(levels) - 1, -1, -1):
+            await asyncio.gather(*(cleanup_one(cid, cname) for cid, cname in levels[depth]))
+        logger.info("Cleanup Complete.")
 
-        print("Starting Recursive Cleanup (Post-Order)...")
-        cleanup_recursive(root_id, category_name)
-        print("\nCleanup Complete.")
+    finally:
+        await client.kill_session()
 
+def cleanup_category():
+    _log_listener.start()
+    try:
+        asyncio.run(_cleanup_category())
     finally:
-        client.kill_session()
+        _log_listener.stop()
+        _log_stream.flush()
 
 if __name__ == "__main__":
-    cleanup_category()
\ No newline at end of file
+    cleanup_category()
@@ -1,6 +1,5 @@
-import requests
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+import asyncio
+import aiohttp
 
 import config
 
@@ -22,24 +21,44 @@ headers = {
     "Content-Type": "application/json"
 }
 
-print(f"Testing connection to {BASE_URL} with User-Token...")
 
-for ep in endpoints:
+async def probe(session, ep):
+    """Probe one endpoint; return printable result lines."""
     url = BASE_URL + ep
-    print(f"\n--- Testing: {url} ---")
+    lines = [f"\n--- Testing: {url} ---"]
     try:
-        # Use verify setting from config
-        ssl_verify = config.VERIFY_SSL
-        response = requests.get(url, headers=headers, verify=ssl_verify, timeout=5)
-        print(f"Status: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('Content-Type', 'Unknown')}")
-        
-        try:
-            json_resp = response.json()
-            print(f"JSON Response: {json_resp}")
-        except:
-            preview = response.text[:200].replace('\n', ' ')
-            print(f"Text Response: {preview}...")
-            
+        async with session.get(url, headers=headers,
+                               timeout=aiohttp.ClientTimeout(total=5)) as response:
+            lines.append(f"Status: {response.status}")
+            lines.append(f"Content-Type: {response.headers.get('Content-Type', 'Unknown')}")
+
+            try:
+                json_resp = await response.json(content_type=None)
+                lines.append(f"JSON Response: {json_resp}")
+            except Exception:
+                text = await response.text()
+                preview = text[:200].replace('\n', ' ')
+                lines.append(f"Text Response: {preview}...")
+
     except Exception as e:
-        print(f"Error: {e}")
+        lines.append(f"Error: {e}")
+    return lines
+
+
+async def main():
+    print(f"Testing connection to {BASE_URL} with User-Token...")
+
+    # Probe all endpoints concurrently (worst case ~1 timeout instead of 4),
+    # then print in input order so output stays deterministic.
+    ssl_arg = config.VERIFY_SSL if config.VERIFY_SSL else False
+    connector = aiohttp.TCPConnector(ssl=ssl_arg)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(*(probe(session, ep) for ep in endpoints))
+
+    for lines in results:
+        for line in lines:
+            print(line)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
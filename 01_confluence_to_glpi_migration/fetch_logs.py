@@ -0,0 +1,51 @@
+import asyncio
+import aiohttp
+
+import config
+
+# Config
+BASE_URL = config.GLPI_URL
+APP_TOKEN = config.APP_TOKEN
+USER_TOKEN = config.USER_TOKEN
+
+# GLPI log files exposed under front/ (admin session required)
+LOG_FILES = [
+    "logs/php-errors.log",
+    "logs/sql-errors.log",
+    "logs/event.log",
+    "logs/cron.log",
+]
+
+headers = {
+    "App-Token": APP_TOKEN,
+    "Authorization": f"user_token {USER_TOKEN}",
+}
+
+
+async def probe(session, filename):
+    """HEAD-probe one log file; return (filename, status or error string)."""
+    url = f"{BASE_URL}/front/{filename}"
+    try:
+        async with session.head(url, headers=headers, allow_redirects=True,
+                                timeout=aiohttp.ClientTimeout(total=5)) as response:
+            return filename, response.status
+    except Exception as e:
+        return filename, f"Error: {e}"
+
+
+async def main():
+    print(f"Probing GLPI log files on {BASE_URL}...")
+
+    # HEAD requests fan out concurrently: existence/size info without
+    # downloading any log body, worst case ~1 timeout instead of N.
+    ssl_arg = config.VERIFY_SSL if config.VERIFY_SSL else False
+    connector = aiohttp.TCPConnector(ssl=ssl_arg)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(*(probe(session, fn) for fn in LOG_FILES))
+
+    for filename, status in results:
+        print(f"  {filename}: {status}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
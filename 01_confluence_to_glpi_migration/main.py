@@ -1,10 +1,47 @@
 """
 Confluence to GLPI Knowledge Base Migration
 Migrates Confluence HTML export to GLPI KB articles with category structure
+
+Files are processed concurrently with asyncio + aiohttp: HTTP round-trips
+(image uploads, KB creation) overlap across files, while HTML parsing runs
+in a thread pool. Concurrency is bounded by migration.concurrency in config.
 """
+import argparse
+import asyncio
+import json
+import logging
 import os
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+import aiofiles
+
+# Console fallback when no structured logger is configured. Level-filtered
+# (WARNING by default, see main()), so per-file chatter never reaches a
+# slow terminal unless asked for — print() would flush every line and
+# serialize the concurrent pipeline on stdout.
+_console = logging.getLogger(__name__)
+
+# Confluence export filenames end with _<page_id>.html
+_CONFLUENCE_ID_RE = re.compile(r'_(\d+)\.html$')
+
+
+def iter_html_files(directory):
+    """
+    Yield .html file paths under directory, recursively.
+
+    scandir's DirEntry carries cached type info, so large export trees
+    are swept without a stat syscall per entry (unlike os.walk).
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_html_files(entry.path)
+            elif entry.name.endswith('.html'):
+                # Optional: Skip navigation files
+                # if entry.name == 'index.html': continue
+                yield entry.path
 
 
 def build_confluence_url(file_path, export_dir, base_url):
@@ -30,7 +67,7 @@ def build_confluence_url(file_path, export_dir, base_url):
     filename = os.path.basename(file_path)
 
     # Extract page_id from trailing _<digits>.html
-    match = re.search(r'_(\d+)\.html$', filename)
+    match = _CONFLUENCE_ID_RE.search(filename)
     if not match:
         return None, None
     page_id = match.group(1)
@@ -51,7 +88,7 @@ def build_confluence_url(file_path, export_dir, base_url):
     return page_id, url
 
 # Import from shared library
-from common.clients.glpi_client import GlpiClient
+from common.clients.async_glpi_client import AsyncGlpiClient
 from common.config.loader import load_config
 
 # Import local modules
@@ -59,19 +96,83 @@ from parser import ConfluenceParser
 from css_styles import CONFLUENCE_CSS
 
 
-def main():
-    """Main migration orchestrator."""
+STATE_FILE = "migration_state.json"
+STATE_FLUSH_EVERY = 25  # entries between state-file writes
 
-    # Load configuration
-    try:
-        config = load_config(validate=False)  # Skip validation for legacy Python config
-    except FileNotFoundError:
-        print("Error: Configuration file not found.")
-        print("Please create config.py or config.yaml with your settings.")
-        return
-    except Exception as e:
-        print(f"Error loading configuration: {e}")
-        return
+
+class MigrationState:
+    """
+    Resume log: filename -> {'kb_id': int, 'uploaded_images': {path: url}}.
+
+    A re-run after an interruption skips files whose KB item was already
+    created and reuses the GLPI document URL for images that already made
+    it up, instead of re-uploading everything. Writes go to a temp file
+    and os.replace (atomic), batched every STATE_FLUSH_EVERY updates to
+    bound fsync cost.
+    """
+
+    def __init__(self, path=STATE_FILE):
+        self.path = path
+        self.entries = {}
+        self.doc_cache = {}  # content digest -> GLPI document ID
+        self._dirty = 0
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if 'files' in data:
+                    self.entries = data.get('files', {})
+                    self.doc_cache = data.get('doc_cache', {})
+                else:
+                    # Legacy layout: flat filename -> entry mapping
+                    self.entries = data
+            except (ValueError, OSError) as e:
+                print(f"Warning: Could not read state file {path}: {e}")
+
+    def _entry(self, filename):
+        return self.entries.setdefault(
+            filename, {'kb_id': None, 'uploaded_images': {}})
+
+    def is_done(self, filename):
+        entry = self.entries.get(filename)
+        return bool(entry) and entry.get('kb_id') is not None
+
+    def image_url(self, filename, local_path):
+        entry = self.entries.get(filename)
+        if not entry:
+            return None
+        return entry.get('uploaded_images', {}).get(local_path)
+
+    def record_image(self, filename, local_path, doc_url):
+        self._entry(filename)['uploaded_images'][local_path] = doc_url
+        self._mark_dirty()
+
+    def record_done(self, filename, kb_id):
+        self._entry(filename)['kb_id'] = kb_id
+        self._mark_dirty()
+
+    def record_doc_cache(self, mapping):
+        if mapping != self.doc_cache:
+            self.doc_cache = dict(mapping)
+            self._dirty += 1
+
+    def _mark_dirty(self):
+        self._dirty += 1
+        if self._dirty >= STATE_FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        if not self._dirty:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.entries, 'doc_cache': self.doc_cache}, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = 0
+
+
+async def migrate(config):
+    """Async migration pipeline: parse files and push to GLPI concurrently."""
 
     # Optional: Setup structured logging if logging config is present
     logger = None
@@ -82,12 +183,10 @@ def main():
         except Exception as e:
             print(f"Warning: Could not initialize logger: {e}")
 
-    # Helper function: Use logger if available, otherwise print
+    # Helper function: Use the structured logger if configured, otherwise
+    # the level-filtered console logger.
     def log(message, level="info"):
-        if logger:
-            getattr(logger, level)(message)
-        else:
-            print(message)
+        getattr(logger or _console, level)(message)
 
     # Extract config values
     glpi_url = config.get('glpi', {}).get('url')
@@ -98,10 +197,12 @@ def main():
     confluence_base_url = config.get('confluence', {}).get('base_url', '')
     debug_mode = config.get('migration', {}).get('debug', False)
     batch_size = config.get('migration', {}).get('batch_size', 50)
+    concurrency = config.get('migration', {}).get('concurrency', 8)
 
     log("=== Confluence to GLPI Knowledge Base Migration ===")
     if debug_mode:
         log(f"[DEBUG MODE] Will stop after 1 batch (batch_size={batch_size})")
+    log(f"Concurrency: {concurrency} files in flight")
     log("")
 
     # Validation
@@ -118,18 +219,19 @@ def main():
         return
 
     # Initialize GLPI client
-    glpi = GlpiClient(
+    glpi = AsyncGlpiClient(
         url=glpi_url,
         app_token=app_token,
         user_token=user_token,
         username=config.get('glpi', {}).get('username'),
         password=config.get('glpi', {}).get('password'),
-        verify_ssl=verify_ssl
+        verify_ssl=verify_ssl,
+        concurrency=concurrency * 2  # a few requests in flight per file
     )
 
     try:
         # Initialize session
-        glpi.init_session()
+        await glpi.init_session()
         log("✓ GLPI session initialized\n")
     except Exception as e:
         log(f"Failed to initialize GLPI session: {e}", "error")
@@ -138,120 +240,209 @@ def main():
 
     # Load user caches for user linking
     log("Loading GLPI user cache...")
-    glpi.load_user_cache(recursive=True)
+    await glpi.load_user_cache(recursive=True)
     log(f"Loaded {len(glpi.user_cache)} users, {len(glpi.fullname_cache)} fullnames\n")
 
+    # Resume log from any previous interrupted run
+    state = MigrationState()
+    if state.entries:
+        log(f"Resume state loaded: {len(state.entries)} file(s) seen before.\n")
+    if state.doc_cache:
+        glpi.load_doc_cache(state.doc_cache)
+        log(f"Seeded document-dedupe cache: {len(state.doc_cache)} entries.\n")
+
     # Statistics
     processed_count = 0
+    skipped_count = 0
     error_count = 0
 
-    try:
-        # Walk through export directory
-        log(f"Scanning directory: {export_dir}\n")
+    loop = asyncio.get_running_loop()
+    file_semaphore = asyncio.Semaphore(concurrency)
 
-        for root, dirs, files in os.walk(export_dir):
-            for filename in files:
-                if not filename.endswith(".html"):
-                    continue
+    # Dedicated pool for HTML parsing, sized to core count. A process pool
+    # would parse faster in principle, but the pipeline mutates the live
+    # bs4 tree after upload (update_image_src) and soup objects can't
+    # cross a process boundary; threads work well enough here since lxml
+    # releases the GIL while building the tree.
+    parse_pool = ThreadPoolExecutor(
+        max_workers=os.cpu_count(), thread_name_prefix="parse"
+    )
 
-                file_path = os.path.join(root, filename)
+    async def process_file(file_path):
+        """Parse one Confluence file and push images + KB item to GLPI."""
+        nonlocal processed_count, skipped_count, error_count
+        filename = os.path.basename(file_path)
+
+        if state.is_done(filename):
+            log(f"Skipping (already migrated): {filename}", "debug")
+            skipped_count += 1
+            return
+
+        async with file_semaphore:
+            log(f"Processing: {filename}", "debug")
+
+            try:
+                # Read asynchronously (deep I/O queue across concurrent
+                # files), then parse on the thread pool: the CPU-bound
+                # parse never waits on disk and vice versa
+                async with aiofiles.open(file_path, 'rb') as f:
+                    html_content = await f.read()
+
+                parser = ConfluenceParser(file_path)
+                await loop.run_in_executor(parse_pool, parser.parse, html_content)
+
+                # Resolve user references to GLPI profile links
+                unresolved_mentions = parser.resolve_user_mentions(glpi.user_cache)
+                unresolved_metadata = parser.resolve_metadata_users(glpi.get_user_id_by_fullname)
+                for u in unresolved_mentions:
+                    log(f"  - Unresolved @mention: {u}", "warning")
+                for u in unresolved_metadata:
+                    log(f"  - Unresolved metadata user: {u}", "warning")
+
+                # Process images: upload all of an article's images in
+                # parallel instead of one round-trip at a time
+                async def upload_image(img_data):
+                    local_path = img_data['local_path']
+                    img_tag = img_data['tag']
+
+                    if not os.path.exists(local_path):
+                        log(f"    Warning: Image file not found at {local_path}", "warning")
+                        return
 
-                # Optional: Skip navigation files
-                # if filename == 'index.html': continue
-
-                log(f"Processing: {filename}")
-
-                try:
-                    # Parse Confluence HTML
-                    parser = ConfluenceParser(file_path)
-                    parser.parse()
-
-                    # Resolve user references to GLPI profile links
-                    unresolved_mentions = parser.resolve_user_mentions(glpi.user_cache)
-                    unresolved_metadata = parser.resolve_metadata_users(glpi.get_user_id_by_fullname)
-                    for u in unresolved_mentions:
-                        log(f"  - Unresolved @mention: {u}", "warning")
-                    for u in unresolved_metadata:
-                        log(f"  - Unresolved metadata user: {u}", "warning")
-
-                    # Process images
-                    for img_data in parser.images:
-                        local_path = img_data['local_path']
-                        img_tag = img_data['tag']
-
-                        if os.path.exists(local_path):
-                            log(f"  - Uploading image: {os.path.basename(local_path)}")
-                            doc_id = glpi.upload_document(local_path)
-
-                            if doc_id:
-                                # Update image src to GLPI document URL
-                                doc_url = f"/front/document.send.php?docid={doc_id}"
-                                parser.update_image_src(img_tag, doc_url)
-                            else:
-                                log("    Failed to upload image.", "warning")
-                        else:
-                            log(f"    Warning: Image file not found at {local_path}", "warning")
-
-                    # Build content
-                    content = parser.get_content_html()
-
-                    # Inject CSS styles
-                    content = CONFLUENCE_CSS + "\n" + content
-
-                    subject = parser.title
-
-                    # Add metadata (author/history)
-                    if parser.metadata_html:
-                        content = parser.metadata_html + "<hr>" + content
-
-                    # Add Confluence source link
-                    page_id, confluence_url = build_confluence_url(file_path, export_dir, confluence_base_url)
-                    if confluence_url:
-                        content += (
-                            f"<br><hr>"
-                            f"<p style='color: #888; font-size: 0.8em;'>"
-                            f"Source: <a href='{confluence_url}' target='_blank'>View on Confluence</a>"
-                            f" (Page ID {page_id})</p>"
-                        )
-                    elif page_id:
-                        content += f"<br><hr><p style='color: #888; font-size: 0.8em;'>Reference: Confluence Page ID {page_id}</p>"
-
-                    # Resolve category path from breadcrumbs
-                    category_id = 0
-
-                    if parser.breadcrumbs:
-                        log(f"  - Resolving Category Path: {' > '.join(parser.breadcrumbs)}")
-                        category_id = glpi.ensure_category_path(parser.breadcrumbs)
-                    else:
-                        log("  - No breadcrumbs found. Item will be in Root (0).")
+                    # Uploaded on a previous (interrupted) run?
+                    cached_url = state.image_url(filename, local_path)
+                    if cached_url:
+                        parser.update_image_src(img_tag, cached_url)
+                        return
 
-                    # Create KB item
-                    kb_id = glpi.create_knowbase_item(subject, content, category_id)
+                    log(f"  - Uploading image: {os.path.basename(local_path)}", "debug")
+                    doc_id = await glpi.upload_document(local_path)
 
-                    if kb_id:
-                        log(f"  ✓ Created KB Item ID: {kb_id}\n")
-                        processed_count += 1
+                    if doc_id:
+                        # Update image src to GLPI document URL
+                        doc_url = f"/front/document.send.php?docid={doc_id}"
+                        state.record_image(filename, local_path, doc_url)
+                        parser.update_image_src(img_tag, doc_url)
                     else:
-                        log("  ✗ Failed to create KB item.\n", "error")
-                        error_count += 1
+                        log("    Failed to upload image.", "warning")
+
+                if parser.images:
+                    await asyncio.gather(*(upload_image(d) for d in parser.images))
+
+                subject = parser.title
+
+                # Assemble the final document with one join: repeated +
+                # on a multi-MB content string reallocates it each time.
+                # Order: metadata (author/history), CSS styles, content,
+                # Confluence source link.
+                parts = []
+
+                if parser.metadata_html:
+                    parts.append(parser.metadata_html)
+                    parts.append("<hr>")
+
+                parts.append(CONFLUENCE_CSS)
+                parts.append("\n")
+                parts.append(parser.get_content_html())
+
+                page_id, confluence_url = build_confluence_url(file_path, export_dir, confluence_base_url)
+                if confluence_url:
+                    parts.append(
+                        f"<br><hr>"
+                        f"<p style='color: #888; font-size: 0.8em;'>"
+                        f"Source: <a href='{confluence_url}' target='_blank'>View on Confluence</a>"
+                        f" (Page ID {page_id})</p>"
+                    )
+                elif page_id:
+                    parts.append(f"<br><hr><p style='color: #888; font-size: 0.8em;'>Reference: Confluence Page ID {page_id}</p>")
+
+                content = "".join(parts)
+
+                # Resolve category path from breadcrumbs
+                category_id = 0
+
+                if parser.breadcrumbs:
+                    log(f"  - Resolving Category Path: {' > '.join(parser.breadcrumbs)}", "debug")
+                    category_id = await glpi.ensure_category_path(parser.breadcrumbs)
+                else:
+                    log("  - No breadcrumbs found. Item will be in Root (0).", "debug")
+
+                # Create KB item
+                kb_id = await glpi.create_knowbase_item(subject, content, category_id)
+
+                if kb_id:
+                    log(f"  ✓ Created KB Item ID: {kb_id}\n", "debug")
+                    state.record_done(filename, kb_id)
+                    processed_count += 1
+                else:
+                    log("  ✗ Failed to create KB item.\n", "error")
+                    error_count += 1
 
-                    # Debug mode: stop after batch_size files
-                    if debug_mode and processed_count >= batch_size:
-                        log(f"\n[DEBUG] debug=true → Processed {processed_count} files (batch_size={batch_size}). Stopping.", "debug")
-                        return
+            except Exception as e:
+                log(f"  Error processing content: {e}\n", "error")
+                error_count += 1
 
-                except Exception as e:
-                    log(f"  Error processing content: {e}\n", "error")
-                    error_count += 1
+    try:
+        # Collect HTML files from export directory
+        log(f"Scanning directory: {export_dir}\n")
+
+        html_files = list(iter_html_files(export_dir))
+
+        # Debug mode: only process the first batch
+        if debug_mode and len(html_files) > batch_size:
+            log(f"[DEBUG] debug=true → Limiting run to first {batch_size} files.", "debug")
+            html_files = html_files[:batch_size]
+
+        log(f"Found {len(html_files)} HTML files.\n")
+
+        await asyncio.gather(*(process_file(p) for p in html_files))
 
     finally:
-        glpi.kill_session()
+        state.record_doc_cache(glpi.dump_doc_cache())
+        state.flush()
+        parse_pool.shutdown(wait=False)
+        await glpi.kill_session()
         log(f"\n{'='*50}")
         log(f"Migration Complete!")
         log(f"  Processed: {processed_count}")
+        log(f"  Skipped:   {skipped_count}")
         log(f"  Errors:    {error_count}")
         log(f"{'='*50}")
 
 
+def main():
+    """Main migration orchestrator (sync entry point)."""
+
+    arg_parser = argparse.ArgumentParser(
+        description="Confluence to GLPI Knowledge Base migration")
+    arg_parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help="show per-file progress (default: warnings and errors only)")
+    args = arg_parser.parse_args()
+
+    # Load configuration
+    try:
+        config = load_config(validate=False)  # Skip validation for legacy Python config
+    except FileNotFoundError:
+        print("Error: Configuration file not found.")
+        print("Please create config.py or config.yaml with your settings.")
+        return
+    except Exception as e:
+        print(f"Error loading configuration: {e}")
+        return
+
+    # Console verbosity: warnings only by default; --verbose restores the
+    # progress output; migration.debug shows everything.
+    if config.get('migration', {}).get('debug', False):
+        level = logging.DEBUG
+    elif args.verbose:
+        level = logging.INFO
+    else:
+        level = logging.WARNING
+    logging.basicConfig(level=level, format='%(message)s', stream=sys.stderr)
+
+    asyncio.run(migrate(config))
+
+
 if __name__ == "__main__":
     main()
@@ -1,109 +1,291 @@
 import os
+import re
 from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
 from urllib.parse import unquote
 
+# Leading "1. " / "2. " numbering on breadcrumb entries
+_BREADCRUMB_NUM_RE = re.compile(r'^\d+\.\s*')
+
+# Inline styles for Confluence tables so they render correctly in GLPI.
+# GLPI often strips <style> tags, so inline styles on elements are safer.
+_TABLE_STYLE = "border-collapse: collapse; width: 100%; margin: 10px 0; font-size: 14px;"
+_TH_STYLE = "border: 1px solid #ddd; padding: 8px; text-align: left; vertical-align: top; background-color: #f2f2f2; font-weight: bold; color: #333;"
+_TD_STYLE = "border: 1px solid #ddd; padding: 8px; text-align: left; vertical-align: top;"
+_TD_HIGHLIGHT_STYLE = " background-color: #fffae6;"
+
+# Opening table/th/td tags in serialized HTML (attrs always double-quoted
+# by bs4's serializer)
+_STYLED_TAG_RE = re.compile(r'<(table|th|td)\b([^>]*)>')
+_CLASS_ATTR_RE = re.compile(r'class="([^"]*)"')
+_STYLE_ATTR_RE = re.compile(r'style="([^"]*)"')
+
+
+def _inject_styles(html):
+    """
+    Append the Confluence table styles to serialized HTML in one regex
+    pass, instead of mutating every table/th/td node in the parse tree.
+    """
+    # Most Confluence pages have no tables at all; a C-level substring
+    # check skips the whole regex pass for them.
+    if 'confluenceT' not in html:
+        return html
+
+    def repl(match):
+        tag, attrs = match.group(1), match.group(2)
+
+        class_match = _CLASS_ATTR_RE.search(attrs)
+        if not class_match:
+            return match.group(0)
+        classes = class_match.group(1).split()
+
+        if tag == 'table' and 'confluenceTable' in classes:
+            new_style = _TABLE_STYLE
+        elif tag == 'th' and 'confluenceTh' in classes:
+            new_style = _TH_STYLE
+        elif tag == 'td' and 'confluenceTd' in classes:
+            new_style = _TD_STYLE
+            # specific highlight support
+            if 'highlight' in classes:
+                new_style += _TD_HIGHLIGHT_STYLE
+        else:
+            return match.group(0)
+
+        # Merge existing style with new style
+        style_match = _STYLE_ATTR_RE.search(attrs)
+        if style_match:
+            merged = f"{style_match.group(1)}; {new_style}".strip('; ')
+            attrs = attrs[:style_match.start(1)] + merged + attrs[style_match.end(1):]
+            return f'<{tag}{attrs}>'
+        return f'<{tag}{attrs} style="{new_style.strip("; ")}">'
+
+    return _STYLED_TAG_RE.sub(repl, html)
+
+# Optional C-based parser for the extraction-only fast path (parse_fast)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+class _ContentStrainer(ElementFilter):
+    """SoupStrainer-style filter keeping only the regions parse() reads.
+
+    Matched tags keep their whole subtree (bs4 only consults the filter
+    outside an already-created tag), so everything inside main-content —
+    tables, images, links — is still fully parsed.
+    """
+
+    _KEEP_IDS = ('title-heading', 'breadcrumbs', 'main-content')
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        if name in ('title', 'h1'):
+            return True
+        attrs = attrs or {}
+        if attrs.get('id') in self._KEEP_IDS:
+            return True
+        classes = attrs.get('class') or ()
+        if isinstance(classes, str):
+            classes = classes.split()
+        return 'breadcrumbs' in classes or 'page-metadata' in classes
+
+    def allow_string_creation(self, string):
+        # Only consulted for text outside every kept region.
+        return False
+
+
+# Confluence exports carry large navigation/sidebar/footer markup that the
+# parser never reads; straining skips building tree nodes for all of it.
+_CONTENT_STRAINER = _ContentStrainer()
+
+
 class ConfluenceParser:
-    def __init__(self, file_path):
+    def __init__(self, file_path, features='lxml'):
         self.file_path = file_path
+        self.features = features  # bs4 tree builder; C-based lxml by default
         self.soup = None
         self.title = None
         self.content_div = None
         self.images = [] # List of (img_tag, local_path)
 
-    def add_inline_styles(self):
+    def _scan(self):
         """
-        Inline styles for Confluence tables to ensure they render correctly in GLPI.
-        GLPI often strips <style> tags, so inline styles on elements are safer.
+        Single pass over the tree collecting every node parse() needs.
+
+        Each bs4 find/find_all walks the whole tree again; one descendants
+        loop with an if/elif ladder replaces ~7 scattered traversals.
         """
-        if not self.soup:
-            return
+        buckets = {
+            'title_heading': None,  # h1#title-heading
+            'doc_title': None,      # <title>
+            'bread_div': None,      # div.breadcrumbs
+            'bread_ol': None,       # ol#breadcrumbs
+            'main_content': None,   # div#main-content
+            'page_metadata': None,  # div.page-metadata
+            'imgs': [],
+        }
 
-        # 1. Tables
-        for table in self.soup.find_all('table', class_='confluenceTable'):
-            # Merge existing style with new style
-            existing = table.get('style', '')
-            new_style = "border-collapse: collapse; width: 100%; margin: 10px 0; font-size: 14px;"
-            table['style'] = f"{existing}; {new_style}".strip('; ')
-
-        # 2. Table Headers (th)
-        for th in self.soup.find_all('th', class_='confluenceTh'):
-            existing = th.get('style', '')
-            new_style = "border: 1px solid #ddd; padding: 8px; text-align: left; vertical-align: top; background-color: #f2f2f2; font-weight: bold; color: #333;"
-            th['style'] = f"{existing}; {new_style}".strip('; ')
-
-        # 3. Table Cells (td)
-        for td in self.soup.find_all('td', class_='confluenceTd'):
-            existing = td.get('style', '')
-            new_style = "border: 1px solid #ddd; padding: 8px; text-align: left; vertical-align: top;"
-            # specific highlight support
-            if 'highlight' in td.get('class', []):
-                new_style += " background-color: #fffae6;"
-            
-            td['style'] = f"{existing}; {new_style}".strip('; ')
+        for tag in self.soup.descendants:
+            name = tag.name
+            if name is None:  # NavigableString / comment
+                continue
+            classes = tag.get('class') or []
 
-    def parse(self):
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        self.soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # INJECT INLINE STYLES
-        self.add_inline_styles()
-        
-        # 1. Extract Title (Raw)
-        # Priority: h1#title-heading > title
-        h1_title = self.soup.find('h1', id='title-heading')
-        if h1_title:
-            self.title = h1_title.get_text(strip=True)
-        else:
-            self.title = self.soup.title.string if self.soup.title else "Untitled"
-        
-        # 2. Extract Breadcrumbs
-        # Usually <ol id="breadcrumbs"> or <div class="breadcrumbs">
-        self.breadcrumbs = []
-        bread_div = self.soup.find('div', class_='breadcrumbs')
-        if not bread_div:
-            bread_div = self.soup.find('ol', id='breadcrumbs')
-            
-        if bread_div:
-            # Extract list items
-            items = bread_div.find_all('li')
-            for item in items:
-                text = item.get_text(strip=True)
-                # Remove numbers "1. ", "2. " if present
-                # Regex remove leading digit
-                import re
-                clean_text = re.sub(r'^\d+\.\s*', '', text)
-                if clean_text:
-                    self.breadcrumbs.append(clean_text)
+            if name == 'img':
+                buckets['imgs'].append(tag)
+            elif name == 'h1':
+                if buckets['title_heading'] is None and tag.get('id') == 'title-heading':
+                    buckets['title_heading'] = tag
+            elif name == 'title':
+                if buckets['doc_title'] is None:
+                    buckets['doc_title'] = tag
+            elif name == 'div':
+                if buckets['bread_div'] is None and 'breadcrumbs' in classes:
+                    buckets['bread_div'] = tag
+                if buckets['main_content'] is None and tag.get('id') == 'main-content':
+                    buckets['main_content'] = tag
+                if buckets['page_metadata'] is None and 'page-metadata' in classes:
+                    buckets['page_metadata'] = tag
+            elif name == 'ol':
+                if buckets['bread_ol'] is None and tag.get('id') == 'breadcrumbs':
+                    buckets['bread_ol'] = tag
 
-        # 3. Dynamic Title Cleaning
-        # Remove prefix based on Space Name (First Breadcrumb)
-        # e.g. Title: "Space Name : Page Title" -> "Page Title"
+        return buckets
+
+    def _clean_title(self):
+        """
+        Dynamic Title Cleaning.
+        Remove prefix based on Space Name (First Breadcrumb)
+        e.g. Title: "Space Name : Page Title" -> "Page Title"
+        """
         clean_title = self.title.strip()
-        
+
         if self.breadcrumbs:
             space_name = self.breadcrumbs[0]
             # Check if title strictly starts with space name
             # use lower case check to be safe or strict
             # Titles have " - " or " : " separator
-            if clean_title.lower().startswith(space_name.lower()):
+            # Compare only the prefix: lowercasing the whole title would
+            # allocate a full copy per file
+            if clean_title[:len(space_name)].casefold() == space_name.casefold():
                  # Remove space name
                  clean_title = clean_title[len(space_name):].strip()
                  # Remove common separators at the start
                  clean_title = clean_title.lstrip(":- ").strip()
-        
+
         self.title = clean_title
 
+    def parse_fast(self):
+        """
+        Extraction-only fast path: decode title, breadcrumbs and metadata
+        with selectolax's Lexbor C parser instead of building a bs4 tree.
+
+        Does NOT populate content_div or images (no mutation support), so
+        it suits callers that only need the decoded fields — dry runs,
+        duplicate checks, category pre-scans. Falls back to the full bs4
+        parse() when selectolax is not installed.
+        """
+        if LexborHTMLParser is None:
+            self.parse()
+            return
+
+        # Raw bytes: Lexbor detects the encoding itself, skipping the
+        # intermediate decoded str entirely
+        with open(self.file_path, 'rb') as f:
+            html_content = f.read()
+
+        tree = LexborHTMLParser(html_content)
+
+        # 1. Title: same priority as parse() (h1#title-heading > title)
+        node = tree.css_first('h1#title-heading')
+        if node:
+            self.title = node.text(strip=True)
+        else:
+            node = tree.css_first('title')
+            self.title = node.text(strip=True) if node else "Untitled"
+
+        # 2. Breadcrumbs
+        self.breadcrumbs = [
+            clean for li in tree.css('div.breadcrumbs li, ol#breadcrumbs li')
+            if (clean := _BREADCRUMB_NUM_RE.sub('', li.text(strip=True)))
+        ]
+
+        # 3. Dynamic Title Cleaning
+        self._clean_title()
+
+        # 4. Metadata (Author/Date)
+        self.metadata_html = ""
+        meta = tree.css_first('div.page-metadata')
+        if meta:
+            text = meta.text(separator=' ', strip=True)
+            self.metadata_html = f"<p style='color: #666; font-style: italic; font-size: 0.9em;'>{text}</p>"
+
+    def parse(self, html_content=None):
+        """
+        Parse the Confluence export file.
+
+        Args:
+            html_content: Raw file bytes, if the caller already read them
+                          (e.g. via async file I/O); read from file_path
+                          when omitted.
+        """
+        # Raw bytes in, lxml does the encoding detection (from the
+        # <meta charset>/BOM): no intermediate decoded str is built, which
+        # cuts peak memory by roughly the document size on large pages.
+        if html_content is None:
+            with open(self.file_path, 'rb') as f:
+                html_content = f.read()
+
+        self.soup = BeautifulSoup(html_content, self.features,
+                                  parse_only=_CONTENT_STRAINER)
+        if self.soup.find('div', id='main-content') is None:
+            # Export variant without a main-content div: re-parse the whole
+            # document so the <body> fallback below has something to find.
+            self.soup = BeautifulSoup(html_content, self.features)
+
+        # Collect all needed nodes in one traversal
+        # (table styling happens at serialization time in get_content_html)
+        buckets = self._scan()
+
+        # 1. Extract Title (Raw)
+        # Priority: h1#title-heading > title
+        h1_title = buckets['title_heading']
+        if h1_title:
+            self.title = h1_title.get_text(strip=True)
+        else:
+            doc_title = buckets['doc_title']
+            self.title = doc_title.string if doc_title else "Untitled"
+
+        # 2. Extract Breadcrumbs
+        # Usually <ol id="breadcrumbs"> or <div class="breadcrumbs">
+        self.breadcrumbs = []
+        bread_div = buckets['bread_div'] or buckets['bread_ol']
+
+        if bread_div:
+            # Extract list items, stripping "1. " / "2. " numbering and
+            # dropping empties in one comprehension
+            self.breadcrumbs = [
+                clean for item in bread_div.find_all('li')
+                if (clean := _BREADCRUMB_NUM_RE.sub('', item.get_text(strip=True)))
+            ]
+
+        # 3. Dynamic Title Cleaning
+        self._clean_title()
+
         # 4. Extract Content
-        self.content_div = self.soup.find('div', id='main-content')
+        self.content_div = buckets['main_content']
         if not self.content_div:
             # Fallback
             self.content_div = self.soup.find('body')
 
         if self.content_div:
-            # Find images
-            imgs = self.content_div.find_all('img')
+            # Images were bucketed document-wide; keep only those inside
+            # the content div (ancestry walk is just the tag's depth)
+            if self.content_div is buckets['main_content']:
+                imgs = [img for img in buckets['imgs']
+                        if self.content_div in img.parents]
+            else:
+                imgs = self.content_div.find_all('img')
             for img in imgs:
                 src = img.get('src')
                 if src:
@@ -127,7 +309,7 @@ class ConfluenceParser:
         # Usually in <div class="page-metadata">
         # Or look for pattern "Created by ... on ..."
         self.metadata_html = ""
-        meta_div = self.soup.find('div', class_='page-metadata')
+        meta_div = buckets['page_metadata']
         if meta_div:
             # Convert to a nice paragraph
             # Fix: use separator=' ' to avoid "Created byName"
@@ -214,9 +396,10 @@ class ConfluenceParser:
         return unresolved
 
     def get_content_html(self):
-        """Return the modified inner HTML of the content div."""
+        """Return the modified inner HTML of the content div, with the
+        Confluence table styles injected into the serialized markup."""
         if self.content_div:
-            return self.content_div.decode_contents()
+            return _inject_styles(self.content_div.decode_contents())
         return ""
 
     def update_image_src(self, img_tag, new_src):
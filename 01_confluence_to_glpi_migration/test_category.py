@@ -0,0 +1,66 @@
+"""
+Quick verification that KB categories are reachable through the API.
+Resolves the configured cleanup category and fetches its record, reusing
+the GlpiClient session (keep-alive) instead of ad-hoc requests.get calls.
+"""
+import logging
+import sys
+
+# Import from shared library
+from common.config.loader import load_config
+from common.clients.glpi_client import GlpiClient
+
+
+def main():
+    # Console fallback for the client's module logger (no-op if logging
+    # is already configured)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    cfg = load_config(validate=False)
+
+    category_name = cfg.get('cleanup', {}).get('default_category')
+    glpi_url = cfg.get('glpi', {}).get('url')
+    app_token = cfg.get('glpi', {}).get('app_token')
+    user_token = cfg.get('glpi', {}).get('user_token')
+    verify_ssl = cfg.get('glpi', {}).get('verify_ssl', False)
+
+    if not category_name:
+        print("Error: cleanup.default_category is empty in config.yaml.")
+        sys.exit(1)
+
+    client = GlpiClient(
+        url=glpi_url,
+        app_token=app_token,
+        user_token=user_token,
+        verify_ssl=verify_ssl
+    )
+
+    try:
+        client.init_session()
+
+        cat_id = client.get_kb_category_id(category_name)
+        if not cat_id:
+            print(f"[-] Category '{category_name}' not found.")
+            sys.exit(1)
+
+        print(f"[+] Category '{category_name}' resolved to ID {cat_id}")
+
+        # Fetch the record over the client's pooled session: no fresh
+        # TCP+TLS handshake per verification call
+        endpoint = f"{client.url}/KnowbaseItemCategory/{cat_id}"
+        response = client.session.get(endpoint, headers=client.headers, timeout=10)
+
+        if response.ok:
+            data = response.json()
+            print(f"[+] Record fetched: name={data.get('name')!r} "
+                  f"parent={data.get('knowbaseitemcategories_id')}")
+        else:
+            print(f"[-] Fetch failed: {response.status_code} - {response.text[:200]}")
+            sys.exit(1)
+
+    finally:
+        client.kill_session()
+
+
+if __name__ == "__main__":
+    main()
@@ -34,20 +34,22 @@ if not user_token:
     print("Error: user_token is required in config.yaml for this script.")
     sys.exit(1)
 
-# Global Headers for API
-headers = {
+# One pooled session: connection keep-alive amortizes the TCP+TLS
+# handshake across the calls below
+session = requests.Session()
+session.headers.update({
     'App-Token': app_token,
     'Content-Type': 'application/json'
-}
+})
+session.verify = verify_ssl
 
 # ==========================================
 # FUNCTION 1: Init Session
 # ==========================================
 def init_session():
-    auth_headers = headers.copy()
-    auth_headers['Authorization'] = f"user_token {user_token}"
-    
-    response = requests.get(f"{glpi_url}/initSession", headers=auth_headers, verify=verify_ssl)
+    auth_headers = {'Authorization': f"user_token {user_token}"}
+
+    response = session.get(f"{glpi_url}/initSession", headers=auth_headers, timeout=10)
     
     if response.status_code == 200:
         session_token = response.json().get('session_token')
@@ -61,8 +63,7 @@ def init_session():
 # FUNCTION 2: Find User by Email Field
 # ==========================================
 def get_user_by_email(session_token, email):
-    search_headers = headers.copy()
-    search_headers['Session-Token'] = session_token
+    search_headers = {'Session-Token': session_token}
     
     params = {
         'criteria[0][field]': '5',
@@ -74,7 +75,7 @@ def get_user_by_email(session_token, email):
     }
     
     print(f"[*] Searching for user with email: {email}...")
-    response = requests.get(f"{glpi_url}/search/User", headers=search_headers, params=params, verify=verify_ssl)
+    response = session.get(f"{glpi_url}/search/User", headers=search_headers, params=params, timeout=10)
     
     if response.status_code == 200:
         data = response.json()
@@ -112,4 +113,4 @@ if __name__ == "__main__":
         print("MAPPING SUCCESS: You can now use this ID to assign (assign) to a Ticket.")
     
     # Always kill session to free up GLPI server resources
-    requests.get(f"{glpi_url}/killSession", headers={'Session-Token': session_token, 'App-Token': app_token}, verify=verify_ssl)
\ No newline at end of file
+    session.get(f"{glpi_url}/killSession", headers={'Session-Token': session_token}, timeout=10)
\ No newline at end of file
@@ -2,6 +2,7 @@
 Jira to GLPI Migration Script - Refactored Version 2.0
 Migrates support tickets from Jira to GLPI Assistance with resumable state
 """
+import logging
 import os
 import time
 
@@ -236,6 +237,10 @@ def main():
 
     # Setup logging
     logger = setup_logger("migration", config)
+    # setup_logger only configures the "migration" logger; give the
+    # shared clients' module loggers a console fallback too (no-op if
+    # the root logger is already configured)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     logger.info("=== Jira Support to GLPI Assistance Migration v2.0 ===")
     logger.info(f"Script started at: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(script_start))}")
 
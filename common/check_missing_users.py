@@ -23,6 +23,7 @@ if _script_dir in sys.path:
 sys.path.insert(0, os.path.abspath(os.path.join(_script_dir, '..')))
 
 import argparse
+import logging
 import urllib3
 
 from common.config.loader import load_config
@@ -338,6 +339,10 @@ def main():
     )
     args = parser.parse_args()
 
+    # Console fallback for the client's module logger (no-op if logging
+    # is already configured)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Load config
     config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
     config = load_config(config_path, validate=False)
@@ -0,0 +1,825 @@
+"""
+Async GLPI REST API Client (aiohttp)
+Async counterpart of GlpiClient for I/O-bound migrations.
+Overlaps HTTP round-trips to GLPI across many files/images concurrently.
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import mimetypes
+import base64
+import unicodedata
+import re
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Load the system MIME database once at import instead of lazily inside
+# the first upload.
+mimetypes.init()
+
+
+@functools.lru_cache(maxsize=128)
+def _guess_mime(ext):
+    """MIME type for a lowercase file extension (attachments cluster in a
+    handful of types, so this is a dict hit after the first few calls)."""
+    return mimetypes.types_map.get(ext, 'application/octet-stream')
+
+
+def _file_digest(file_path, chunk_size=1 << 16):
+    """blake2b-128 hexdigest of a file, read in chunks.
+
+    blake2b is the fastest hash built into CPython; 128 bits is plenty
+    for upload dedupe."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _normalize_name(name):
+    """
+    Normalize a display name for fuzzy matching.
+    Strips accents, lowercases, collapses whitespace.
+    """
+    if not name:
+        return ""
+    normalized = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', normalized.lower().strip())
+
+
+class AsyncGlpiClient:
+    """
+    Async GLPI REST API v1 Client built on aiohttp.
+
+    Mirrors the subset of GlpiClient used by the migration pipelines:
+    - Session management (User Token + Basic Auth fallback)
+    - User cache
+    - Knowledge Base operations (items + categories)
+    - Document handling
+
+    All requests share one aiohttp.ClientSession (connection pooling),
+    and a Semaphore caps in-flight requests to protect the GLPI server.
+    """
+
+    def __init__(self, url, app_token, user_token=None, username=None, password=None,
+                 verify_ssl=False, concurrency=16):
+        """
+        Initialize async GLPI client.
+
+        Args:
+            url: GLPI API base URL (e.g., https://glpi.example.com/api.php/v1)
+            app_token: Application token
+            user_token: User token (optional, tried first)
+            username: Username for Basic Auth fallback (optional)
+            password: Password for Basic Auth fallback (optional)
+            verify_ssl: Verify SSL certificates (default: False)
+            concurrency: Max concurrent requests to GLPI (default: 16)
+        """
+        self.url = url.rstrip('/')
+        self.app_token = app_token
+        self.user_token = user_token
+        self.username = username
+        self.password = password
+        self.verify_ssl = verify_ssl
+        self.concurrency = concurrency
+        self.session_token = None
+        self.headers = {
+            "App-Token": self.app_token,
+            "Content-Type": "application/json"
+        }
+
+        # Created in init_session (needs a running event loop)
+        self._session = None
+        self._semaphore = None
+
+        # Caches
+        self.user_cache = {}      # email (lowercase) -> user_id
+        self.fullname_cache = {}  # normalized fullname -> user_id
+        self._kb_cat_cache = {}   # (name, parent_id) -> KB category_id
+        self._path_cache = {}     # (root_id, *names) -> leaf KB category_id
+        self._doc_cache = {}      # file content digest -> document_id (upload dedupe)
+
+    # ===== Session Management =====
+
+    async def init_session(self):
+        """
+        Initialize GLPI session.
+        Tries User Token first, then falls back to Basic Auth if provided.
+        """
+        connector = aiohttp.TCPConnector(limit=32, ssl=self.verify_ssl if self.verify_ssl else False)
+        self._session = aiohttp.ClientSession(connector=connector)
+        # Bounded variant: raises if ever over-released, so a refactoring
+        # bug can't silently lift the request cap on the GLPI server.
+        self._semaphore = asyncio.BoundedSemaphore(self.concurrency)
+
+        endpoint = f"{self.url}/initSession"
+
+        # 1. Try User Token
+        if self.user_token:
+            logger.info("Attempting authentication with User-Token...")
+            headers = self.headers.copy()
+            headers["Authorization"] = f"user_token {self.user_token}"
+
+            try:
+                async with self._session.get(endpoint, headers=headers) as response:
+                    if response.ok:
+                        data = await response.json()
+                        self.session_token = data.get("session_token")
+                        self.headers["Session-Token"] = self.session_token
+                        logger.info("Session initialized (User-Token): %s", self.session_token)
+                        return
+                    else:
+                        logger.error("User-Token failed (Status: %s).", response.status)
+            except Exception as e:
+                logger.error("User-Token connection error: %s", e)
+
+        # 2. Fallback to Basic Auth
+        if self.username and self.password:
+            logger.info("Attempting fallback to Basic Auth (User: %s)...", self.username)
+            auth_str = f"{self.username}:{self.password}"
+            b64_auth = base64.b64encode(auth_str.encode()).decode()
+
+            headers = self.headers.copy()
+            headers["Authorization"] = f"Basic {b64_auth}"
+
+            try:
+                async with self._session.get(endpoint, headers=headers) as response:
+                    if not response.ok:
+                        body = await response.text()
+                        logger.error("Basic Auth failed. Status: %s", response.status)
+                        logger.error("Response Body: %s", body)
+                    response.raise_for_status()
+
+                    data = await response.json()
+                    self.session_token = data.get("session_token")
+                    self.headers["Session-Token"] = self.session_token
+                    logger.info("Session initialized (Basic Auth): %s", self.session_token)
+                    return
+            except Exception as e:
+                logger.error("Basic Auth connection error: %s", e)
+                raise
+
+        # If here, failure
+        await self._session.close()
+        logger.error("Error: Could not initialize session with any credentials.")
+        raise Exception("Authentication Failed")
+
+    async def kill_session(self):
+        """Kill the current GLPI session and close the HTTP session."""
+        if self._session is None:
+            return
+        if self.session_token:
+            endpoint = f"{self.url}/killSession"
+            try:
+                async with self._session.get(endpoint, headers=self.headers):
+                    logger.info("Session killed.")
+            except Exception as e:
+                logger.error("Error killing session: %s", e)
+        await self._session.close()
+        self._session = None
+
+    async def change_active_entity(self, entity_id=0, is_recursive=True):
+        """
+        Switch the active entity for the session.
+
+        Args:
+            entity_id: Entity ID (default: 0 = root)
+            is_recursive: Include sub-entities (default: True)
+
+        Returns:
+            bool: True if successful
+        """
+        endpoint = f"{self.url}/changeActiveEntities"
+        payload = {
+            "entities_id": entity_id,
+            "is_recursive": 1 if is_recursive else 0
+        }
+        try:
+            async with self._semaphore:
+                async with self._session.post(endpoint, headers=self.headers, json=payload) as response:
+                    response.raise_for_status()
+            logger.info("Switched to entity ID %s (recursive=%s).", entity_id, is_recursive)
+            return True
+        except Exception as e:
+            logger.error("Failed to switch entity to %s: %s", entity_id, e)
+            return False
+
+    # ===== User Cache =====
+
+    async def load_user_cache(self, recursive=True):
+        """
+        Load ALL GLPI users into memory cache for O(1) lookups.
+
+        Args:
+            recursive: Include users from sub-entities (default: True)
+        """
+        logger.info("Loading GLPI User Cache (Recursive)..." if recursive else "Loading GLPI User Cache...")
+        endpoint = f"{self.url}/search/User"
+        params = {
+            "range": "0-10000",
+            "forcedisplay[0]": "5",  # email
+            "forcedisplay[1]": "2",  # id
+            "forcedisplay[2]": "9",  # realname (lastname)
+            "forcedisplay[3]": "34", # firstname
+            "is_deleted": "0"        # Only active users
+        }
+        if recursive:
+            params["is_recursive"] = "1"
+
+        try:
+            async with self._semaphore:
+                async with self._session.get(endpoint, headers=self.headers, params=params) as response:
+                    response.raise_for_status()
+                    result = await response.json()
+
+            data = result.get('data', [])
+            if data:
+                for item in data:
+                    email = str(item.get('5', '')).lower().strip()
+                    user_id = item.get('2')
+                    if email and user_id:
+                        self.user_cache[email] = user_id
+
+                    realname = str(item.get('9', '') or '').strip()
+                    firstname = str(item.get('34', '') or '').strip()
+                    if user_id and (firstname or realname):
+                        fullname = f"{realname} {firstname}".strip()
+                        normalized = _normalize_name(fullname)
+                        if normalized:
+                            self.fullname_cache[normalized] = user_id
+
+            logger.info("-> Loaded %s users, %s fullnames into cache.", len(self.user_cache), len(self.fullname_cache))
+
+        except Exception as e:
+            logger.error("[ERROR] Failed to load user cache: %s", e)
+
+    def get_user_id_by_email(self, email):
+        """
+        Get GLPI User ID by email address (pre-loaded cache, O(1)).
+
+        Args:
+            email: User email address
+
+        Returns:
+            int: User ID or None
+        """
+        if not email:
+            return None
+        return self.user_cache.get(email.lower())
+
+    def get_user_id_by_fullname(self, display_name):
+        """
+        Get GLPI User ID by display name (pre-loaded cache, O(1)).
+
+        Args:
+            display_name: User display name
+
+        Returns:
+            int: User ID or None
+        """
+        if not display_name:
+            return None
+        return self.fullname_cache.get(_normalize_name(display_name))
+
+    # ===== Knowledge Base Operations =====
+
+    async def create_knowbase_item(self, subject, content, category_id=0):
+        """
+        Create a Knowledge Base entry.
+
+        Args:
+            subject: KB item title
+            content: KB item content (HTML)
+            category_id: KnowbaseItemCategory ID (default: 0 = root)
+
+        Returns:
+            int: KB item ID or None
+        """
+        endpoint = f"{self.url}/KnowbaseItem"
+        payload = {
+            "input": {
+                "name": subject,
+                "answer": content,
+                "is_faq": 1,
+                "knowbaseitemcategories_id": category_id,
+            }
+        }
+
+        try:
+            async with self._semaphore:
+                async with self._session.post(endpoint, headers=self.headers, json=payload) as response:
+                    response.raise_for_status()
+                    result = await response.json()
+            logger.info("Created KB Item '%s': ID %s", subject, result.get('id'))
+            return result.get('id')
+        except Exception as e:
+            logger.error("Failed to create KB Item '%s': %s", subject, e)
+            return None
+
+    async def get_kb_category_id(self, name, parent_id=0):
+        """
+        Find Knowledge Base category ID by name and parent.
+        Memoized: repeated lookups for the same (name, parent) pair
+        skip the HTTP search. Only positive hits are cached.
+
+        Args:
+            name: Category name
+            parent_id: Parent category ID (default: 0 = root)
+
+        Returns:
+            int: Category ID or None
+        """
+        cache_key = (name, int(parent_id))
+        cat_id = self._kb_cat_cache.get(cache_key)
+        if cat_id is not None:
+            return cat_id
+
+        cat_id = await self._search_kb_category_id(name, parent_id)
+        if cat_id is not None:
+            self._kb_cat_cache[cache_key] = cat_id
+        return cat_id
+
+    async def _search_kb_category_id(self, name, parent_id=0):
+        """Uncached KB category search (three-pass fallback chain).
+
+        Mirrors the sync client: the searchText listing misses categories
+        in some entity configurations, and a silent miss here would make
+        ensure_category_path create a duplicate.
+        """
+        endpoint = f"{self.url}/KnowbaseItemCategory"
+
+        # --- Pass 1: search with searchText filter ---
+        params = {
+            "is_deleted": 0,
+            "searchText": name,
+            "range": "0-1000",
+            "is_recursive": 1
+        }
+        try:
+            async with self._semaphore:
+                async with self._session.get(endpoint, headers=self.headers, params=params) as response:
+                    data = await response.json() if response.status == 200 else None
+            if isinstance(data, list) and data:
+                for item in data:
+                    if item.get("name") == name:
+                        item_parent = item.get("knowbaseitemcategories_id", 0)
+                        if int(item_parent) == int(parent_id):
+                            return item.get("id")
+            else:
+                logger.debug("  [DEBUG] KnowbaseItemCategory searchText='%s' returned: %s", name, data)
+        except Exception as e:
+            logger.error("Error searching KB category %s: %s", name, e)
+
+        # --- Pass 2: fallback — fetch ALL via direct endpoint (limited to current entity) ---
+        logger.debug("  [DEBUG] Falling back to full scan for KB category '%s' (parent_id=%s)...", name, parent_id)
+        try:
+            params_all = {
+                "is_deleted": 0,
+                "range": "0-5000",
+                "is_recursive": 1
+            }
+            async with self._semaphore:
+                async with self._session.get(endpoint, headers=self.headers, params=params_all) as response:
+                    data = await response.json() if response.status == 200 else None
+            if isinstance(data, list):
+                logger.debug("  [DEBUG] Full scan returned %s categories", len(data))
+                for item in data:
+                    if item.get("name") == name:
+                        item_parent = item.get("knowbaseitemcategories_id", 0)
+                        logger.debug("  [DEBUG] Found match: '%s' with parent=%s (looking for parent=%s), id=%s", name, item_parent, parent_id, item.get('id'))
+                        if int(item_parent) == int(parent_id):
+                            return item.get("id")
+            else:
+                logger.debug("  [DEBUG] Full scan returned non-list: %s", data)
+        except Exception as e:
+            logger.error("Error in full-scan for KB category %s: %s", name, e)
+
+        # --- Pass 3: use /search/ endpoint (cross-entity, recursive) ---
+        logger.debug("  [DEBUG] Trying /search/ endpoint for KB category '%s'...", name)
+        try:
+            search_endpoint = f"{self.url}/search/KnowbaseItemCategory"
+            search_params = {
+                "criteria[0][field]": "1",        # name field
+                "criteria[0][searchtype]": "equals",
+                "criteria[0][value]": name,
+                "forcedisplay[0]": "1",           # name
+                "forcedisplay[1]": "2",           # id
+                "forcedisplay[2]": "3",           # parent category id
+                "range": "0-1000",
+                "is_recursive": 1
+            }
+            async with self._semaphore:
+                async with self._session.get(search_endpoint, headers=self.headers, params=search_params) as response:
+                    result = await response.json() if response.status == 200 else {}
+            data = result.get('data', []) or []
+            logger.debug("  [DEBUG] /search/ returned %s results", len(data))
+            for item in data:
+                item_name = str(item.get('1', ''))
+                item_id = item.get('2')
+                item_parent = item.get('3', 0) or 0
+                logger.debug("  [DEBUG] search result: name='%s', id=%s, parent=%s", item_name, item_id, item_parent)
+                if item_name == name:
+                    if int(item_parent) == int(parent_id):
+                        return item_id
+        except Exception as e:
+            logger.error("Error in /search/ for KB category %s: %s", name, e)
+
+        return None
+
+    async def create_kb_category(self, name, parent_id=0):
+        """
+        Create a new Knowledge Base category.
+
+        Args:
+            name: Category name
+            parent_id: Parent category ID (default: 0 = root)
+
+        Returns:
+            int: Category ID or None
+        """
+        endpoint = f"{self.url}/KnowbaseItemCategory"
+        payload = {
+            "input": {
+                "name": name,
+                "knowbaseitemcategories_id": parent_id
+            }
+        }
+        try:
+            async with self._semaphore:
+                async with self._session.post(endpoint, headers=self.headers, json=payload) as response:
+                    response.raise_for_status()
+                    result = await response.json()
+            new_id = result.get('id')
+            if new_id:
+                self._kb_cat_cache[(name, int(parent_id))] = new_id
+            return new_id
+        except Exception as e:
+            logger.error("Failed to create KB category %s: %s", name, e)
+            return None
+
+    async def ensure_category_path(self, path_list, root_id=0):
+        """
+        Traverse KB category path, creating categories as needed.
+
+        Serialized with a lock so concurrent files sharing a path prefix
+        don't race and create duplicate categories.
+
+        Args:
+            path_list: List of category names (e.g., ['Parent', 'Child'])
+            root_id: Starting parent ID (default: 0 = root)
+
+        Returns:
+            int: ID of the last category in the path
+        """
+        names = [n.strip() for n in path_list if n.strip()]
+        if not names:
+            return root_id
+
+        # Sibling pages share the exact same breadcrumb path: a hit here
+        # skips the per-segment walk AND the lock acquisition below.
+        path_key = (root_id, *names)
+        if path_key in self._path_cache:
+            return self._path_cache[path_key]
+
+        if not hasattr(self, '_category_lock'):
+            self._category_lock = asyncio.Lock()
+
+        async with self._category_lock:
+            # Resume from the longest already-resolved prefix (pages under
+            # a new leaf still share ancestors with earlier pages).
+            start = 0
+            current_parent_id = root_id
+            for i in range(len(names) - 1, 0, -1):
+                cached = self._path_cache.get((root_id, *names[:i]))
+                if cached is not None:
+                    start = i
+                    current_parent_id = cached
+                    break
+
+            for i in range(start, len(names)):
+                name = names[i]
+                cat_id = await self.get_kb_category_id(name, current_parent_id)
+                if not cat_id:
+                    logger.info("Creating KB Category: %s (Parent: %s)", name, current_parent_id)
+                    cat_id = await self.create_kb_category(name, current_parent_id)
+
+                if cat_id:
+                    current_parent_id = cat_id
+                    # Cache every resolved prefix, not just the full path
+                    self._path_cache[(root_id, *names[:i + 1])] = cat_id
+                else:
+                    logger.warning("Warning: Could not resolve KB category %s. Using parent.", name)
+                    break
+
+            return current_parent_id
+
+    async def get_kb_children_map(self):
+        """
+        Fetch ALL KB categories in one request and bucket them by parent.
+
+        One bulk GET replaces the per-node "list children of parent=X"
+        round-trip (classic N+1) during tree traversals.
+
+        Returns:
+            dict: {parent_id: [child category dicts]}
+        """
+        endpoint = f"{self.url}/KnowbaseItemCategory"
+        params = {
+            "is_deleted": 0,
+            "is_recursive": 1
+        }
+        children_map = {}
+        # Page until a short page so large category tables aren't
+        # silently truncated by a fixed range
+        start = 0
+        step = 1000
+        while True:
+            params['range'] = f"{start}-{start + step - 1}"
+            try:
+                async with self._semaphore:
+                    async with self._session.get(endpoint, headers=self.headers, params=params) as response:
+                        response.raise_for_status()
+                        data = await response.json()
+            except Exception as e:
+                # GLPI answers 400 when the range starts past the total;
+                # anything else is a real error worth surfacing.
+                if start == 0:
+                    logger.error("Error fetching KB category tree: %s", e)
+                break
+
+            if not isinstance(data, list) or not data:
+                break
+            for cat in data:
+                parent = int(cat.get('knowbaseitemcategories_id', 0))
+                children_map.setdefault(parent, []).append(cat)
+            if len(data) < step:
+                break
+            start += step
+
+        return children_map
+
+    # KnowbaseItem search option IDs (see listSearchOptions/KnowbaseItem)
+    KB_FIELD_ID = 2        # id
+    KB_FIELD_CATEGORY = 4  # knowbaseitemcategories_id
+    KB_FIELD_ANSWER = 6    # answer (content)
+
+    async def get_knowbase_items(self, category_id=None):
+        """
+        Get list of KB items, optionally filtered by category.
+
+        Category filtering happens server-side via the Search API, so we
+        no longer download rows just to discard them in Python. Pages
+        through results until the server returns a short page, so large
+        categories are no longer silently truncated.
+
+        Args:
+            category_id: Filter by category ID (optional)
+
+        Returns:
+            list: List of KB item dicts (id / answer / category at minimum)
+        """
+        if category_id:
+            return await self._search_knowbase_items(category_id)
+
+        # No expand_dropdowns: hydrating every foreign key to its display
+        # string multiplies the payload and nothing downstream reads them.
+        endpoint = f"{self.url}/KnowbaseItem"
+        params = {
+            "is_deleted": 0
+        }
+
+        items = []
+        start = 0
+        step = 200
+        while True:
+            params['range'] = f"{start}-{start + step - 1}"
+            try:
+                async with self._semaphore:
+                    async with self._session.get(endpoint, headers=self.headers, params=params) as response:
+                        response.raise_for_status()
+                        data = await response.json()
+            except Exception as e:
+                # GLPI answers 400 when the range starts past the total;
+                # anything else is a real error worth surfacing.
+                if start == 0:
+                    logger.error("Error fetching KB items: %s", e)
+                break
+
+            chunk = []
+            if isinstance(data, list):
+                chunk = data
+            elif isinstance(data, dict):
+                chunk = data.get('data', [])
+
+            if not chunk:
+                break
+            items.extend(chunk)
+            if len(chunk) < step:
+                break
+            start += step
+
+        return items
+
+    async def _search_knowbase_items(self, category_id):
+        """Server-side filtered KB item fetch for one category."""
+        endpoint = f"{self.url}/search/KnowbaseItem"
+        params = {
+            "criteria[0][field]": self.KB_FIELD_CATEGORY,
+            "criteria[0][searchtype]": "equals",
+            "criteria[0][value]": category_id,
+            "forcedisplay[0]": self.KB_FIELD_ID,
+            "forcedisplay[1]": self.KB_FIELD_ANSWER,
+        }
+
+        items = []
+        start = 0
+        step = 200
+        while True:
+            params['range'] = f"{start}-{start + step - 1}"
+            try:
+                async with self._semaphore:
+                    async with self._session.get(endpoint, headers=self.headers, params=params) as response:
+                        response.raise_for_status()
+                        result = await response.json()
+            except Exception as e:
+                if start == 0:
+                    logger.error("Error searching KB items for category %s: %s", category_id, e)
+                break
+
+            rows = result.get('data', []) or []
+            for row in rows:
+                items.append({
+                    'id': row.get(str(self.KB_FIELD_ID)),
+                    'answer': row.get(str(self.KB_FIELD_ANSWER)),
+                    'knowbaseitemcategories_id': category_id,
+                })
+
+            if len(rows) < step:
+                break
+            start += step
+
+        return items
+
+    async def delete_knowbase_item(self, item_id):
+        """
+        Delete a KB item by ID.
+
+        Args:
+            item_id: KB item ID
+
+        Returns:
+            bool: True if successful
+        """
+        endpoint = f"{self.url}/KnowbaseItem/{item_id}"
+        try:
+            async with self._semaphore:
+                async with self._session.delete(endpoint, headers=self.headers,
+                                                params={"force_purge": "true"}) as response:
+                    response.raise_for_status()
+            logger.info("Deleted KB Item ID: %s", item_id)
+            return True
+        except Exception as e:
+            logger.error("Failed to delete KB item %s: %s", item_id, e)
+            return False
+
+    async def delete_kb_category(self, cat_id):
+        """
+        Delete a KB Category by ID.
+
+        Args:
+            cat_id: Category ID
+
+        Returns:
+            bool: True if successful
+        """
+        endpoint = f"{self.url}/KnowbaseItemCategory/{cat_id}"
+        try:
+            async with self._semaphore:
+                async with self._session.delete(endpoint, headers=self.headers,
+                                                params={"force_purge": "true"}) as response:
+                    response.raise_for_status()
+            logger.info("Deleted KB Category ID: %s", cat_id)
+            return True
+        except Exception as e:
+            logger.error("Failed to delete KB category %s: %s", cat_id, e)
+            return False
+
+    # ===== Document Operations =====
+
+    def load_doc_cache(self, mapping):
+        """Seed the upload-dedupe cache (content digest -> document ID),
+        e.g. from a resume log, so re-runs skip re-hashing and re-uploads."""
+        self._doc_cache.update(mapping)
+
+    def dump_doc_cache(self):
+        """Return a copy of the upload-dedupe cache for persistence."""
+        return dict(self._doc_cache)
+
+    async def upload_document(self, file_path, name=None):
+        """
+        Upload a file to GLPI as a Document.
+
+        Identical files (same content hash) are uploaded once and the
+        Document ID reused — shared logos/icons across Confluence pages
+        are common.
+
+        Args:
+            file_path: Path to file
+            name: Document name (default: filename)
+
+        Returns:
+            int: Document ID or None
+        """
+        if not name:
+            name = os.path.basename(file_path)
+
+        # Hash on a worker thread so disk reads don't stall the event loop
+        digest = await asyncio.get_running_loop().run_in_executor(None, _file_digest, file_path)
+        cached_id = self._doc_cache.get(digest)
+        if cached_id:
+            logger.info("Reusing already-uploaded document for %s (ID %s)", name, cached_id)
+            return cached_id
+
+        endpoint = f"{self.url}/Document"
+        manifest = {"input": {"name": name, "_filename": [name]}}
+
+        upload_headers = self.headers.copy()
+        upload_headers.pop("Content-Type", None)
+
+        try:
+            # Keep the handle inside a with block so it is closed even when
+            # the open or the POST raises; this also bounds open FDs to the
+            # number of in-flight uploads once uploads run concurrently.
+            with open(file_path, 'rb') as fh:
+                form = aiohttp.FormData()
+                form.add_field('uploadManifest', json.dumps(manifest), content_type='application/json')
+                form.add_field('filename[0]', fh, filename=name,
+                               content_type=_guess_mime(os.path.splitext(file_path)[1].lower()))
+
+                async with self._semaphore:
+                    async with self._session.post(endpoint, headers=upload_headers, data=form) as response:
+                        if not response.ok:
+                            body = await response.text()
+                            logger.error("Upload failed. Status: %s", response.status)
+                            logger.error("Response: %s", body)
+                        response.raise_for_status()
+                        result = await response.json()
+            logger.info("Uploaded %s: %s", name, result)
+            doc_id = result.get('id')
+            if doc_id:
+                self._doc_cache[digest] = doc_id
+            return doc_id
+        except Exception as e:
+            logger.error("Failed to upload %s: %s", name, e)
+            return None
+
+    async def delete_document(self, doc_id):
+        """
+        Delete a Document by ID.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            bool: True if successful
+        """
+        endpoint = f"{self.url}/Document/{doc_id}"
+        try:
+            async with self._semaphore:
+                async with self._session.delete(endpoint, headers=self.headers,
+                                                params={"force_purge": "true"}) as response:
+                    response.raise_for_status()
+            logger.info("Deleted Document ID: %s", doc_id)
+            return True
+        except Exception as e:
+            logger.error("Failed to delete document %s: %s", doc_id, e)
+            return False
+
+    # ===== Asset/Item Search =====
+
+    async def get_item(self, item_type, item_id):
+        """
+        Get a specific item by ID.
+
+        Args:
+            item_type: Item type (e.g., 'Ticket', 'KnowbaseItem')
+            item_id: Item ID
+
+        Returns:
+            dict: Item data or None
+        """
+        endpoint = f"{self.url}/{item_type}/{item_id}"
+        try:
+            async with self._semaphore:
+                async with self._session.get(endpoint, headers=self.headers) as response:
+                    response.raise_for_status()
+                    return await response.json()
+        except Exception as e:
+            logger.error("Failed to get %s %s: %s", item_type, item_id, e)
+            return None
@@ -4,13 +4,63 @@ Consolidates functionality from all 3 migration folders
 Supports: Knowledge Base, Tickets, Projects, Documents, Caching
 """
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
+import functools
+import hashlib
 import json
+import logging
 import os
 import re
 import mimetypes
 import base64
 import unicodedata
 
+try:
+    import orjson  # optional: 2-5x faster JSON than stdlib
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Load the system MIME database once at import instead of lazily inside
+# the first upload.
+mimetypes.init()
+
+
+@functools.lru_cache(maxsize=128)
+def _guess_mime(ext):
+    """MIME type for a lowercase file extension (attachments cluster in a
+    handful of types, so this is a dict hit after the first few calls)."""
+    return mimetypes.types_map.get(ext, 'application/octet-stream')
+
+
+def _dumps(obj):
+    """Serialize to JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
+def _loads(raw):
+    """Parse JSON bytes/str, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _file_digest(file_path, chunk_size=1 << 16):
+    """blake2b-128 hexdigest of a file, read in chunks.
+
+    blake2b is the fastest hash built into CPython; 128 bits is plenty
+    for upload dedupe."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
 
 def _normalize_name(name):
     """
@@ -39,7 +89,8 @@ class GlpiClient:
     - Asset/Item search
     """
 
-    def __init__(self, url, app_token, user_token=None, username=None, password=None, verify_ssl=False):
+    def __init__(self, url, app_token, user_token=None, username=None, password=None, verify_ssl=False,
+                 log_level=None):
         """
         Initialize GLPI client.
 
@@ -50,7 +101,12 @@ class GlpiClient:
             username: Username for Basic Auth fallback (optional)
             password: Password for Basic Auth fallback (optional)
             verify_ssl: Verify SSL certificates (default: False)
+            log_level: Level for this module's logger (optional); e.g.
+                       logging.WARNING silences per-item INFO output on
+                       bulk runs
         """
+        if log_level is not None:
+            logger.setLevel(log_level)
         self.url = url.rstrip('/')
         self.app_token = app_token
         self.user_token = user_token
@@ -63,97 +119,185 @@ class GlpiClient:
             "Content-Type": "application/json"
         }
 
+        # One pooled HTTP session for all calls: keep-alive avoids a fresh
+        # TCP + TLS handshake per request, and transient 429/5xx get retried
+        # with backoff at the transport layer.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                # No POST: a gateway 502/504 (or a dropped connection) can
+                # arrive after the backend already committed the create, and
+                # every create here is a non-idempotent POST — a transport
+                # replay would silently duplicate migrated objects.
+                allowed_methods=frozenset(['GET', 'PUT', 'DELETE'])
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Set once on the Session instead of per call: requests re-resolves
+        # the CA bundle for every request passed an explicit verify=.
+        self.session.verify = self.verify_ssl
+        # Session headers are the canonical store; self.headers is kept in
+        # sync so code that copies it (uploads) still works.
+        self.session.headers.update(self.headers)
+
         # Caches
         self.user_cache = {}      # login_name (lowercase) -> user_id
         self.fullname_cache = {}  # normalized fullname -> user_id
         self.group_cache = {}     # name (lowercase) -> group_id
         self.category_cache = {}  # name (lowercase) -> category_id (ITIL)
         self.location_cache = {}  # name (lowercase) -> location_id
+        self._kb_cat_cache = {}   # (name, parent_id) -> KB category_id
+        self._kb_tree_primed = False  # set by _prime_category_tree()
+        self._path_cache = {}     # (root_id, *names) -> leaf KB category_id
+        self._doc_cache = {}      # file content digest -> document_id (upload dedupe)
+        self._etag_cache = {}     # (url, params) -> (etag, last_modified, parsed body)
+        self._project_cache = {}  # name -> project_id
+        self._state_map = None    # lazy {name_lower: id}, see get_project_states()
+        self._task_type_map = None  # lazy {name_lower: id}, see get_project_task_types()
+
+        # Precomputed hot-path values: upload header base (rebuilt whenever
+        # auth headers change) and endpoint URLs hit thousands of times.
+        self._refresh_upload_headers()
+        self._project_task_url = f"{self.url}/ProjectTask"
+        self._followup_url = f"{self.url}/ITILFollowup"
 
     # ===== Session Management =====
 
+    def _refresh_upload_headers(self):
+        """Rebuild the upload header base: everything but Content-Type,
+        which multipart uploads must set from the encoder's boundary."""
+        self._upload_headers = {
+            k: v for k, v in self.headers.items() if k != 'Content-Type'
+        }
+
     def init_session(self):
         """
         Initialize GLPI session.
         Tries User Token first, then falls back to Basic Auth if provided.
         """
         endpoint = f"{self.url}/initSession"
-        base_headers = {
-            "App-Token": self.app_token,
-            "Content-Type": "application/json"
-        }
 
         # 1. Try User Token
         if self.user_token:
-            print("Attempting authentication with User-Token...")
-            headers = base_headers.copy()
-            headers["Authorization"] = f"user_token {self.user_token}"
+            logger.info("Attempting authentication with User-Token...")
+            self.headers["Authorization"] = f"user_token {self.user_token}"
+            self.session.headers.update(self.headers)
 
             try:
-                response = requests.get(endpoint, headers=headers, verify=self.verify_ssl)
+                response = self.session.get(endpoint)
                 if response.ok:
-                    data = response.json()
+                    data = _loads(response.content)
                     self.session_token = data.get("session_token")
                     self.headers["Session-Token"] = self.session_token
-                    print(f"Session initialized (User-Token): {self.session_token}")
+                    self.session.headers.update(self.headers)
+                    self._refresh_upload_headers()
+                    logger.info("Session initialized (User-Token): %s", self.session_token)
                     return
                 else:
-                    print(f"User-Token failed (Status: {response.status_code}).")
+                    logger.error("User-Token failed (Status: %s).", response.status_code)
             except Exception as e:
-                print(f"User-Token connection error: {e}")
+                logger.error("User-Token connection error: %s", e)
 
         # 2. Fallback to Basic Auth
         if self.username and self.password:
-            print(f"Attempting fallback to Basic Auth (User: {self.username})...")
+            logger.info("Attempting fallback to Basic Auth (User: %s)...", self.username)
             auth_str = f"{self.username}:{self.password}"
             b64_auth = base64.b64encode(auth_str.encode()).decode()
 
-            headers = base_headers.copy()
-            headers["Authorization"] = f"Basic {b64_auth}"
+            self.headers["Authorization"] = f"Basic {b64_auth}"
+            self.session.headers.update(self.headers)
 
             try:
-                response = requests.get(endpoint, headers=headers, verify=self.verify_ssl)
+                response = self.session.get(endpoint)
                 if not response.ok:
-                    print(f"Basic Auth failed. Status: {response.status_code}")
-                    print(f"Response Body: {response.text}")
+                    logger.error("Basic Auth failed. Status: %s", response.status_code)
+                    logger.error("Response Body: %s", response.text)
                 response.raise_for_status()
 
-                data = response.json()
+                data = _loads(response.content)
                 self.session_token = data.get("session_token")
                 self.headers["Session-Token"] = self.session_token
-                print(f"Session initialized (Basic Auth): {self.session_token}")
+                self.session.headers.update(self.headers)
+                self._refresh_upload_headers()
+                logger.info("Session initialized (Basic Auth): %s", self.session_token)
                 return
             except Exception as e:
-                print(f"Basic Auth connection error: {e}")
+                logger.error("Basic Auth connection error: %s", e)
                 if hasattr(e, 'response') and e.response is not None:
-                    print(f"Response Body: {e.response.text}")
+                    logger.error("Response Body: %s", e.response.text)
                 raise
 
         # If here, failure
-        print("Error: Could not initialize session with any credentials.")
+        logger.error("Error: Could not initialize session with any credentials.")
         raise Exception("Authentication Failed")
 
     def kill_session(self):
-        """Kill the current GLPI session."""
-        if not self.session_token:
-            return
-        endpoint = f"{self.url}/killSession"
-        try:
-            requests.get(endpoint, headers=self.headers, verify=self.verify_ssl)
-            print("Session killed.")
-        except Exception as e:
-            print(f"Error killing session: {e}")
+        """Kill the current GLPI session and release pooled connections."""
+        if self.session_token:
+            endpoint = f"{self.url}/killSession"
+            try:
+                self.session.get(endpoint)
+                logger.info("Session killed.")
+            except Exception as e:
+                logger.error("Error killing session: %s", e)
+        self.session.close()
+
+    def __enter__(self):
+        self.init_session()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.kill_session()
+        return False
+
+    def _get_json(self, endpoint, params=None):
+        """
+        GET + parse with conditional-request caching for list endpoints.
+
+        Remembers ETag/Last-Modified per (URL, params) and replays them as
+        If-None-Match/If-Modified-Since; a 304 answer returns the cached
+        parsed body with zero response bytes and zero JSON parsing.
+        Raises on non-2xx.
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._etag_cache.get(key)
+        cond_headers = {}
+        if cached:
+            etag, last_mod, _ = cached
+            if etag:
+                cond_headers['If-None-Match'] = etag
+            if last_mod:
+                cond_headers['If-Modified-Since'] = last_mod
+
+        response = self.session.get(endpoint, params=params,
+                                    headers=cond_headers or None)
+        if response.status_code == 304 and cached:
+            return cached[2]
+        response.raise_for_status()
+
+        data = _loads(response.content)
+        etag = response.headers.get('ETag')
+        last_mod = response.headers.get('Last-Modified')
+        if etag or last_mod:
+            self._etag_cache[key] = (etag, last_mod, data)
+        return data
 
     def change_active_profile(self, profile_id):
         """Switch the active profile for the session."""
         endpoint = f"{self.url}/changeActiveProfile"
         payload = {"profiles_id": profile_id}
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
             return True
         except Exception as e:
-            print(f"Failed to switch profile to {profile_id}: {e}")
+            logger.error("Failed to switch profile to %s: %s", profile_id, e)
             return False
 
     def change_active_entity(self, entity_id=0, is_recursive=True):
@@ -173,12 +317,12 @@ class GlpiClient:
             "is_recursive": 1 if is_recursive else 0
         }
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            print(f"Switched to entity ID {entity_id} (recursive={is_recursive}).")
+            logger.info("Switched to entity ID %s (recursive=%s).", entity_id, is_recursive)
             return True
         except Exception as e:
-            print(f"Failed to switch entity to {entity_id}: {e}")
+            logger.error("Failed to switch entity to %s: %s", entity_id, e)
             return False
 
     # ===== User Cache =====
@@ -190,7 +334,7 @@ class GlpiClient:
         Args:
             recursive: Include users from sub-entities (default: True)
         """
-        print("Loading GLPI User Cache (Recursive)..." if recursive else "Loading GLPI User Cache...")
+        logger.info("Loading GLPI User Cache (Recursive)..." if recursive else "Loading GLPI User Cache...")
         endpoint = f"{self.url}/search/User"
         params = {
             "range": "0-10000",
@@ -204,10 +348,10 @@ class GlpiClient:
             params["is_recursive"] = "1"
 
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             response.raise_for_status()
 
-            result = response.json()
+            result = _loads(response.content)
             data = result.get('data', [])
 
             if data:
@@ -227,10 +371,10 @@ class GlpiClient:
                         if normalized:
                             self.fullname_cache[normalized] = user_id
 
-            print(f"-> Loaded {len(self.user_cache)} users, {len(self.fullname_cache)} fullnames into cache.")
+            logger.info("-> Loaded %s users, %s fullnames into cache.", len(self.user_cache), len(self.fullname_cache))
 
         except Exception as e:
-            print(f"[ERROR] Failed to load user cache: {e}")
+            logger.error("[ERROR] Failed to load user cache: %s", e)
 
     def get_user_id_by_email(self, email):
         """
@@ -271,7 +415,7 @@ class GlpiClient:
         Args:
             recursive: Include groups from sub-entities (default: True)
         """
-        print("Loading GLPI Group Cache (Recursive)..." if recursive else "Loading GLPI Group Cache...")
+        logger.info("Loading GLPI Group Cache (Recursive)..." if recursive else "Loading GLPI Group Cache...")
         endpoint = f"{self.url}/search/Group"
         params = {
             "range": "0-10000",
@@ -283,10 +427,10 @@ class GlpiClient:
             params["is_recursive"] = "1"
 
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             response.raise_for_status()
 
-            result = response.json()
+            result = _loads(response.content)
             data = result.get('data', [])
 
             if data:
@@ -300,10 +444,10 @@ class GlpiClient:
                     if completename and group_id:
                         self.group_cache[completename] = group_id
 
-            print(f"-> Loaded {len(self.group_cache)} groups into cache.")
+            logger.info("-> Loaded %s groups into cache.", len(self.group_cache))
 
         except Exception as e:
-            print(f"[ERROR] Failed to load group cache: {e}")
+            logger.error("[ERROR] Failed to load group cache: %s", e)
 
     def get_group_id_by_name(self, group_name):
         """
@@ -338,7 +482,7 @@ class GlpiClient:
             return group_id
 
         # Create new group
-        print(f"  [NEW] Creating Group '{group_name}'...")
+        logger.info("  [NEW] Creating Group '%s'...", group_name)
         endpoint = f"{self.url}/Group"
         payload = {
             "input": {
@@ -348,19 +492,19 @@ class GlpiClient:
         }
 
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            result = response.json()
+            result = _loads(response.content)
             new_id = result.get('id')
             if new_id:
                 self.group_cache[group_name.lower()] = new_id
-                print(f"  [NEW] Created Group '{group_name}' -> GLPI ID {new_id}")
+                logger.info("  [NEW] Created Group '%s' -> GLPI ID %s", group_name, new_id)
                 return new_id
             else:
-                print(f"  [ERROR] Group creation returned no ID: {result}")
+                logger.error("  [ERROR] Group creation returned no ID: %s", result)
                 return None
         except Exception as e:
-            print(f"  [ERROR] Failed to create group '{group_name}': {e}")
+            logger.error("  [ERROR] Failed to create group '%s': %s", group_name, e)
             return None
 
     # ===== Category Cache (ITIL Categories) =====
@@ -372,7 +516,7 @@ class GlpiClient:
         Args:
             recursive: Include categories from sub-entities (default: True)
         """
-        print("Loading GLPI ITIL Category Cache...")
+        logger.info("Loading GLPI ITIL Category Cache...")
         endpoint = f"{self.url}/search/ITILCategory"
         params = {
             "range": "0-10000",
@@ -384,10 +528,10 @@ class GlpiClient:
             params["is_recursive"] = "1"
 
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             response.raise_for_status()
 
-            result = response.json()
+            result = _loads(response.content)
             data = result.get('data', [])
 
             if data:
@@ -401,10 +545,10 @@ class GlpiClient:
                     if completename and cat_id:
                         self.category_cache[completename] = cat_id
 
-            print(f"-> Loaded {len(self.category_cache)} categories into cache.")
+            logger.info("-> Loaded %s categories into cache.", len(self.category_cache))
 
         except Exception as e:
-            print(f"[ERROR] Failed to load category cache: {e}")
+            logger.error("[ERROR] Failed to load category cache: %s", e)
 
     def get_or_create_category(self, category_name):
         """
@@ -425,7 +569,7 @@ class GlpiClient:
             return cat_id
 
         # Create new category
-        print(f"  [NEW] Creating ITIL Category '{category_name}'...")
+        logger.info("  [NEW] Creating ITIL Category '%s'...", category_name)
         endpoint = f"{self.url}/ITILCategory"
         payload = {
             "input": {
@@ -438,21 +582,21 @@ class GlpiClient:
         }
 
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            result = response.json()
+            result = _loads(response.content)
             new_id = result.get('id')
             if new_id:
                 self.category_cache[category_name.lower()] = new_id
-                print(f"  [NEW] Created Category '{category_name}' -> GLPI ID {new_id}")
+                logger.info("  [NEW] Created Category '%s' -> GLPI ID %s", category_name, new_id)
                 return new_id
             else:
-                print(f"  [ERROR] Category creation returned no ID: {result}")
+                logger.error("  [ERROR] Category creation returned no ID: %s", result)
                 return None
         except Exception as e:
-            print(f"  [ERROR] Failed to create category '{category_name}': {e}")
+            logger.error("  [ERROR] Failed to create category '%s': %s", category_name, e)
             if hasattr(e, 'response') and e.response:
-                print(f"  Response: {e.response.text}")
+                logger.error("  Response: %s", e.response.text)
             return None
 
     def get_category_id_map(self):
@@ -465,9 +609,9 @@ class GlpiClient:
         endpoint = f"{self.url}/ITILCategory"
         params = {"range": "0-1000"}
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             if response.ok:
-                data = response.json()
+                data = _loads(response.content)
                 return {item['name'].lower(): item['id'] for item in data if 'name' in item}
         except Exception:
             pass
@@ -492,18 +636,21 @@ class GlpiClient:
             }
         }
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            return response.json().get('id')
+            new_id = _loads(response.content).get('id')
+            if new_id:
+                self.category_cache[name.lower()] = new_id
+            return new_id
         except Exception as e:
-            print(f"Failed to create ITIL category '{name}': {e}")
+            logger.error("Failed to create ITIL category '%s': %s", name, e)
             return None
 
     # ===== Location Cache =====
 
     def load_location_cache(self):
         """Load ALL GLPI Locations into memory cache."""
-        print("Loading GLPI Location Cache...")
+        logger.info("Loading GLPI Location Cache...")
         endpoint = f"{self.url}/search/Location"
         params = {
             "range": "0-10000",
@@ -513,10 +660,10 @@ class GlpiClient:
         }
 
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             response.raise_for_status()
 
-            result = response.json()
+            result = _loads(response.content)
             data = result.get('data', [])
 
             if data:
@@ -530,10 +677,10 @@ class GlpiClient:
                     if completename and loc_id:
                         self.location_cache[completename] = loc_id
 
-            print(f"-> Loaded {len(self.location_cache)} locations into cache.")
+            logger.info("-> Loaded %s locations into cache.", len(self.location_cache))
 
         except Exception as e:
-            print(f"[ERROR] Failed to load location cache: {e}")
+            logger.error("[ERROR] Failed to load location cache: %s", e)
 
     def get_location_id(self, location_name):
         """
@@ -574,20 +721,22 @@ class GlpiClient:
         }
 
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            result = response.json()
-            print(f"Created KB Item '{subject}': ID {result.get('id')}")
+            result = _loads(response.content)
+            logger.info("Created KB Item '%s': ID %s", subject, result.get('id'))
             return result.get('id')
         except Exception as e:
-            print(f"Failed to create KB Item '{subject}': {e}")
+            logger.error("Failed to create KB Item '%s': %s", subject, e)
             if hasattr(e, 'response') and e.response:
-                print(e.response.text)
+                logger.error(e.response.text)
             return None
 
     def get_kb_category_id(self, name, parent_id=0):
         """
         Find Knowledge Base category ID by name and parent.
+        Memoized: repeated lookups for the same (name, parent) pair
+        (every breadcrumb segment of every file) skip the HTTP search.
 
         Args:
             name: Category name
@@ -596,6 +745,20 @@ class GlpiClient:
         Returns:
             int: Category ID or None
         """
+        cache_key = (name, int(parent_id))
+        cat_id = self._kb_cat_cache.get(cache_key)
+        if cat_id is not None:
+            return cat_id
+
+        # Only positive hits are cached, so a category created mid-run by
+        # another path is still found on retry.
+        cat_id = self._search_kb_category_id(name, parent_id)
+        if cat_id is not None:
+            self._kb_cat_cache[cache_key] = cat_id
+        return cat_id
+
+    def _search_kb_category_id(self, name, parent_id=0):
+        """Uncached KB category search (three-pass fallback chain)."""
         endpoint = f"{self.url}/KnowbaseItemCategory"
 
         # --- Pass 1: search with searchText filter ---
@@ -606,9 +769,9 @@ class GlpiClient:
             "is_recursive": 1
         }
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if isinstance(data, list) and data:
                     for item in data:
                         if item.get("name") == name:
@@ -616,36 +779,36 @@ class GlpiClient:
                             if int(item_parent) == int(parent_id):
                                 return item.get("id")
                 else:
-                    print(f"  [DEBUG] KnowbaseItemCategory searchText='{name}' returned: {data}")
+                    logger.debug("  [DEBUG] KnowbaseItemCategory searchText='%s' returned: %s", name, data)
         except Exception as e:
-            print(f"Error searching KB category {name}: {e}")
+            logger.error("Error searching KB category %s: %s", name, e)
 
         # --- Pass 2: fallback — fetch ALL via direct endpoint (limited to current entity) ---
-        print(f"  [DEBUG] Falling back to full scan for KB category '{name}' (parent_id={parent_id})...")
+        logger.debug("  [DEBUG] Falling back to full scan for KB category '%s' (parent_id=%s)...", name, parent_id)
         try:
             params_all = {
                 "is_deleted": 0,
                 "range": "0-5000",
                 "is_recursive": 1
             }
-            response = requests.get(endpoint, headers=self.headers, params=params_all, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params_all)
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if isinstance(data, list):
-                    print(f"  [DEBUG] Full scan returned {len(data)} categories")
+                    logger.debug("  [DEBUG] Full scan returned %s categories", len(data))
                     for item in data:
                         if item.get("name") == name:
                             item_parent = item.get("knowbaseitemcategories_id", 0)
-                            print(f"  [DEBUG] Found match: '{name}' with parent={item_parent} (looking for parent={parent_id}), id={item.get('id')}")
+                            logger.debug("  [DEBUG] Found match: '%s' with parent=%s (looking for parent=%s), id=%s", name, item_parent, parent_id, item.get('id'))
                             if int(item_parent) == int(parent_id):
                                 return item.get("id")
                 else:
-                    print(f"  [DEBUG] Full scan returned non-list: {data}")
+                    logger.debug("  [DEBUG] Full scan returned non-list: %s", data)
         except Exception as e:
-            print(f"Error in full-scan for KB category {name}: {e}")
+            logger.error("Error in full-scan for KB category %s: %s", name, e)
 
         # --- Pass 3: use /search/ endpoint (cross-entity, recursive) ---
-        print(f"  [DEBUG] Trying /search/ endpoint for KB category '{name}'...")
+        logger.debug("  [DEBUG] Trying /search/ endpoint for KB category '%s'...", name)
         try:
             search_endpoint = f"{self.url}/search/KnowbaseItemCategory"
             search_params = {
@@ -658,21 +821,21 @@ class GlpiClient:
                 "range": "0-1000",
                 "is_recursive": 1
             }
-            response = requests.get(search_endpoint, headers=self.headers, params=search_params, verify=self.verify_ssl)
+            response = self.session.get(search_endpoint, params=search_params)
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 data = result.get('data', [])
-                print(f"  [DEBUG] /search/ returned {len(data)} results")
+                logger.debug("  [DEBUG] /search/ returned %s results", len(data))
                 for item in data:
                     item_name = str(item.get('1', ''))
                     item_id = item.get('2')
                     item_parent = item.get('3', 0) or 0
-                    print(f"  [DEBUG] search result: name='{item_name}', id={item_id}, parent={item_parent}")
+                    logger.debug("  [DEBUG] search result: name='%s', id=%s, parent=%s", item_name, item_id, item_parent)
                     if item_name == name:
                         if int(item_parent) == int(parent_id):
                             return item_id
         except Exception as e:
-            print(f"Error in /search/ for KB category {name}: {e}")
+            logger.error("Error in /search/ for KB category %s: %s", name, e)
 
         return None
 
@@ -696,17 +859,67 @@ class GlpiClient:
             }
         }
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            return response.json().get('id')
+            new_id = _loads(response.content).get('id')
+            if new_id:
+                self._kb_cat_cache[(name, int(parent_id))] = new_id
+            return new_id
         except Exception as e:
-            print(f"Failed to create KB category {name}: {e}")
+            logger.error("Failed to create KB category %s: %s", name, e)
             return None
 
+    def _prime_category_tree(self):
+        """
+        Fetch the whole KB category tree in one paged listing and seed the
+        (name, parent) cache, so path resolution never needs a per-level
+        search request. No-op after the first successful call.
+        """
+        if self._kb_tree_primed:
+            return
+
+        endpoint = f"{self.url}/KnowbaseItemCategory"
+        params = {"is_deleted": 0, "is_recursive": 1}
+        start = 0
+        step = 1000
+        loaded = 0
+        while True:
+            params['range'] = f"{start}-{start + step - 1}"
+            try:
+                response = self.session.get(endpoint, params=params)
+                response.raise_for_status()
+                data = _loads(response.content)
+            except Exception as e:
+                # A failed prime is not fatal: ensure_category_path falls
+                # back to per-level searches.
+                if start == 0:
+                    logger.error("Could not prime KB category tree: %s", e)
+                    return
+                break
+
+            if not isinstance(data, list) or not data:
+                break
+            for item in data:
+                name = item.get('name')
+                cat_id = item.get('id')
+                parent = item.get('knowbaseitemcategories_id', 0)
+                if name and cat_id:
+                    self._kb_cat_cache[(name, int(parent))] = cat_id
+                    loaded += 1
+            if len(data) < step:
+                break
+            start += step
+
+        self._kb_tree_primed = True
+        logger.info("-> Primed KB category tree: %s categories.", loaded)
+
     def ensure_category_path(self, path_list, root_id=0):
         """
         Traverse KB category path, creating categories as needed.
 
+        The full category tree is fetched once up front; existing levels
+        resolve from memory and only genuinely missing ones cost a POST.
+
         Args:
             path_list: List of category names (e.g., ['Parent', 'Child'])
             root_id: Starting parent ID (default: 0 = root)
@@ -714,80 +927,147 @@ class GlpiClient:
         Returns:
             int: ID of the last category in the path
         """
-        if not path_list:
+        names = [n.strip() for n in path_list if n.strip()]
+        if not names:
             return root_id
 
-        current_parent_id = root_id
+        self._prime_category_tree()
 
-        for name in path_list:
-            name = name.strip()
-            if not name:
-                continue
+        # Sibling pages share the exact same breadcrumb path: one dict
+        # lookup instead of a per-segment walk.
+        path_key = (root_id, *names)
+        if path_key in self._path_cache:
+            return self._path_cache[path_key]
 
-            cat_id = self.get_kb_category_id(name, current_parent_id)
+        # Resume from the longest already-resolved prefix (pages under a
+        # new leaf still share ancestors with earlier pages).
+        start = 0
+        current_parent_id = root_id
+        for i in range(len(names) - 1, 0, -1):
+            cached = self._path_cache.get((root_id, *names[:i]))
+            if cached is not None:
+                start = i
+                current_parent_id = cached
+                break
+
+        for i in range(start, len(names)):
+            name = names[i]
+            cat_id = self._kb_cat_cache.get((name, int(current_parent_id)))
+            if cat_id is None and not self._kb_tree_primed:
+                cat_id = self.get_kb_category_id(name, current_parent_id)
             if not cat_id:
-                print(f"Creating KB Category: {name} (Parent: {current_parent_id})")
+                logger.info("Creating KB Category: %s (Parent: %s)", name, current_parent_id)
                 cat_id = self.create_kb_category(name, current_parent_id)
 
             if cat_id:
                 current_parent_id = cat_id
+                # Cache every resolved prefix, not just the full path
+                self._path_cache[(root_id, *names[:i + 1])] = cat_id
             else:
-                print(f"Warning: Could not resolve KB category {name}. Using parent.")
+                logger.warning("Warning: Could not resolve KB category %s. Using parent.", name)
                 break
 
         return current_parent_id
 
+    # KnowbaseItem search option IDs (see listSearchOptions/KnowbaseItem)
+    KB_FIELD_ID = 2        # id
+    KB_FIELD_CATEGORY = 4  # knowbaseitemcategories_id
+    KB_FIELD_ANSWER = 6    # answer (content)
+
     def get_knowbase_items(self, category_id=None):
         """
         Get list of KB items, optionally filtered by category.
 
+        Category filtering happens server-side via the Search API, so we
+        no longer download rows just to discard them in Python. Pages
+        through results until the server returns a short page, so large
+        categories are no longer silently truncated.
+
         Args:
             category_id: Filter by category ID (optional)
 
         Returns:
-            list: List of KB item dicts
+            list: List of KB item dicts (id / answer / category at minimum)
         """
+        if category_id:
+            return self._search_knowbase_items(category_id)
+
+        # No expand_dropdowns: hydrating every foreign key to its display
+        # string multiplies the payload and nothing downstream reads them.
         endpoint = f"{self.url}/KnowbaseItem"
         params = {
-            "is_deleted": 0,
-            "range": "0-1000",
-            "expand_dropdowns": "true"
+            "is_deleted": 0
         }
 
-        if category_id:
-            params['knowbaseitemcategories_id'] = category_id
-
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
-            response.raise_for_status()
-            data = response.json()
+        items = []
+        start = 0
+        step = 200
+        while True:
+            params['range'] = f"{start}-{start + step - 1}"
+            try:
+                response = self.session.get(endpoint, params=params)
+                response.raise_for_status()
+                data = _loads(response.content)
+            except Exception as e:
+                # GLPI answers 400 when the range starts past the total;
+                # anything else is a real error worth surfacing.
+                if start == 0:
+                    logger.error("Error fetching KB items: %s", e)
+                break
 
-            items = []
+            chunk = []
             if isinstance(data, list):
-                items = data
+                chunk = data
             elif isinstance(data, dict):
-                items = data.get('data', [])
-
-            # Strict filtering if category specified
-            if category_id:
-                filtered_items = []
-                for item in items:
-                    cat_val = item.get('knowbaseitemcategories_id')
-                    if cat_val is None:
-                        filtered_items.append(item)
-                        continue
-                    try:
-                        if int(cat_val) == int(category_id):
-                            filtered_items.append(item)
-                    except ValueError:
-                        pass
-                return filtered_items
-
-            return items
+                chunk = data.get('data', [])
 
-        except Exception as e:
-            print(f"Error fetching KB items: {e}")
-            return []
+            if not chunk:
+                break
+            items.extend(chunk)
+            if len(chunk) < step:
+                break
+            start += step
+
+        return items
+
+    def _search_knowbase_items(self, category_id):
+        """Server-side filtered KB item fetch for one category."""
+        endpoint = f"{self.url}/search/KnowbaseItem"
+        params = {
+            "criteria[0][field]": self.KB_FIELD_CATEGORY,
+            "criteria[0][searchtype]": "equals",
+            "criteria[0][value]": category_id,
+            "forcedisplay[0]": self.KB_FIELD_ID,
+            "forcedisplay[1]": self.KB_FIELD_ANSWER,
+        }
+
+        items = []
+        start = 0
+        step = 200
+        while True:
+            params['range'] = f"{start}-{start + step - 1}"
+            try:
+                response = self.session.get(endpoint, params=params)
+                response.raise_for_status()
+                result = _loads(response.content)
+            except Exception as e:
+                if start == 0:
+                    logger.error("Error searching KB items for category %s: %s", category_id, e)
+                break
+
+            rows = result.get('data', []) or []
+            for row in rows:
+                items.append({
+                    'id': row.get(str(self.KB_FIELD_ID)),
+                    'answer': row.get(str(self.KB_FIELD_ANSWER)),
+                    'knowbaseitemcategories_id': category_id,
+                })
+
+            if len(rows) < step:
+                break
+            start += step
+
+        return items
 
     def delete_knowbase_item(self, item_id):
         """
@@ -801,12 +1081,12 @@ class GlpiClient:
         """
         endpoint = f"{self.url}/KnowbaseItem/{item_id}"
         try:
-            response = requests.delete(endpoint, headers=self.headers, params={"force_purge": "true"}, verify=self.verify_ssl)
+            response = self.session.delete(endpoint, params={"force_purge": "true"})
             response.raise_for_status()
-            print(f"Deleted KB Item ID: {item_id}")
+            logger.info("Deleted KB Item ID: %s", item_id)
             return True
         except Exception as e:
-            print(f"Failed to delete KB item {item_id}: {e}")
+            logger.error("Failed to delete KB item %s: %s", item_id, e)
             return False
 
     def delete_kb_category(self, cat_id):
@@ -821,12 +1101,12 @@ class GlpiClient:
         """
         endpoint = f"{self.url}/KnowbaseItemCategory/{cat_id}"
         try:
-            response = requests.delete(endpoint, headers=self.headers, params={"force_purge": "true"}, verify=self.verify_ssl)
+            response = self.session.delete(endpoint, params={"force_purge": "true"})
             response.raise_for_status()
-            print(f"Deleted KB Category ID: {cat_id}")
+            logger.info("Deleted KB Category ID: %s", cat_id)
             return True
         except Exception as e:
-            print(f"Failed to delete KB category {cat_id}: {e}")
+            logger.error("Failed to delete KB category %s: %s", cat_id, e)
             return False
 
     # ===== Ticket Operations (Assistance) =====
@@ -871,9 +1151,9 @@ class GlpiClient:
         # Try to fetch from API
         endpoint = f"{self.url}/listSearchOptions/Ticket"
         try:
-            response = requests.get(endpoint, headers=self.headers, verify=self.verify_ssl)
+            response = self.session.get(endpoint)
             if response.ok:
-                data = response.json()
+                data = _loads(response.content)
                 status_field = data.get('12', {})
                 choices = status_field.get('k', {}) or status_field.get('choices', {})
 
@@ -881,10 +1161,10 @@ class GlpiClient:
                     api_map = {}
                     for k, v in choices.items():
                         api_map[str(v).lower()] = int(k)
-                    print(f"Loaded {len(api_map)} statuses from GLPI API.")
+                    logger.info("Loaded %s statuses from GLPI API.", len(api_map))
                     return api_map
         except Exception as e:
-            print(f"Failed to fetch statuses from API ({e}), using default.")
+            logger.error("Failed to fetch statuses from API (%s), using default.", e)
 
         return standard_statuses
 
@@ -904,9 +1184,9 @@ class GlpiClient:
         # Try to fetch from API
         endpoint = f"{self.url}/listSearchOptions/Ticket"
         try:
-            response = requests.get(endpoint, headers=self.headers, verify=self.verify_ssl)
+            response = self.session.get(endpoint)
             if response.ok:
-                data = response.json()
+                data = _loads(response.content)
                 type_field = data.get('14', {})
                 choices = type_field.get('k', {}) or type_field.get('choices', {})
 
@@ -914,10 +1194,10 @@ class GlpiClient:
                     api_map = {}
                     for k, v in choices.items():
                         api_map[str(v).lower()] = int(k)
-                    print(f"Loaded {len(api_map)} types from GLPI API.")
+                    logger.info("Loaded %s types from GLPI API.", len(api_map))
                     return api_map
         except Exception as e:
-            print(f"Failed to fetch types from API ({e}), using default.")
+            logger.error("Failed to fetch types from API (%s), using default.", e)
 
         return standard_types
 
@@ -948,15 +1228,15 @@ class GlpiClient:
             payload['input'].update(kwargs)
 
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            result = response.json()
-            print(f"Created Ticket '{name}': ID {result.get('id')}")
+            result = _loads(response.content)
+            logger.info("Created Ticket '%s': ID %s", name, result.get('id'))
             return result.get('id')
         except Exception as e:
-            print(f"Failed to create Ticket '{name}': {e}")
+            logger.error("Failed to create Ticket '%s': %s", name, e)
             if hasattr(e, 'response') and e.response:
-                print(e.response.text)
+                logger.error(e.response.text)
             return None
 
     def update_ticket(self, ticket_id, **kwargs):
@@ -973,12 +1253,12 @@ class GlpiClient:
         endpoint = f"{self.url}/Ticket/{ticket_id}"
         payload = {"input": kwargs}
         try:
-            response = requests.put(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.put(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            print(f"  -> Updated Ticket {ticket_id}")
+            logger.info("  -> Updated Ticket %s", ticket_id)
             return True
         except Exception as e:
-            print(f"Failed to update Ticket {ticket_id}: {e}")
+            logger.error("Failed to update Ticket %s: %s", ticket_id, e)
             return False
 
     def add_ticket_followup(self, ticket_id, content, users_id=None, is_private=0, date=None):
@@ -995,7 +1275,7 @@ class GlpiClient:
         Returns:
             bool: True if successful
         """
-        endpoint = f"{self.url}/ITILFollowup"
+        endpoint = self._followup_url
         payload = {
             "input": {
                 "items_id": ticket_id,
@@ -1010,11 +1290,11 @@ class GlpiClient:
             payload['input']['date'] = date
 
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
             return True
         except Exception as e:
-            print(f"Failed to add followup to ticket {ticket_id}: {e}")
+            logger.error("Failed to add followup to ticket %s: %s", ticket_id, e)
             return False
 
     def link_item_to_ticket(self, ticket_id, item_type, item_id):
@@ -1038,11 +1318,11 @@ class GlpiClient:
             }
         }
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
             return True
         except Exception as e:
-            print(f"Failed to link {item_type} {item_id} to ticket {ticket_id}: {e}")
+            logger.error("Failed to link %s %s to ticket %s: %s", item_type, item_id, ticket_id, e)
             return False
 
     # ===== Project Operations =====
@@ -1067,15 +1347,17 @@ class GlpiClient:
             }
         }
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            result = response.json()
-            print(f"Created Project '{name}': ID {result.get('id')}")
+            result = _loads(response.content)
+            logger.info("Created Project '%s': ID %s", name, result.get('id'))
+            if result.get('id'):
+                self._project_cache[name] = result['id']
             return result.get('id')
         except Exception as e:
-            print(f"Failed to create Project '{name}': {e}")
+            logger.error("Failed to create Project '%s': %s", name, e)
             if hasattr(e, 'response') and e.response:
-                print(e.response.text)
+                logger.error(e.response.text)
             return None
 
     def get_project_id_by_name(self, name):
@@ -1088,6 +1370,8 @@ class GlpiClient:
         Returns:
             int: Project ID or None
         """
+        if name in self._project_cache:
+            return self._project_cache[name]
         endpoint = f"{self.url}/Project"
         params = {
             "is_deleted": 0,
@@ -1095,15 +1379,16 @@ class GlpiClient:
             "range": "0-10"
         }
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if isinstance(data, list):
                     for item in data:
                         if item.get("name") == name:
+                            self._project_cache[name] = item.get("id")
                             return item.get("id")
         except Exception as e:
-            print(f"Error searching project {name}: {e}")
+            logger.error("Error searching project %s: %s", name, e)
         return None
 
     def get_project_states(self):
@@ -1113,13 +1398,11 @@ class GlpiClient:
         Returns:
             dict: {name_lower: id}
         """
+        if self._state_map is not None:
+            return self._state_map
         endpoint = f"{self.url}/ProjectState"
         try:
-            params = {"range": "0-1000"}
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
-            response.raise_for_status()
-
-            states = response.json()
+            states = self._get_json(endpoint, params={"range": "0-1000"})
             if not states:
                 return {}
 
@@ -1129,10 +1412,11 @@ class GlpiClient:
                 sid = s.get('id')
                 if name and sid:
                     state_map[name.lower()] = sid
+            self._state_map = state_map
             return state_map
 
         except Exception as e:
-            print(f"[ERROR] Failed to fetch Project States: {e}")
+            logger.error("[ERROR] Failed to fetch Project States: %s", e)
             return {}
 
     def get_project_task_types(self):
@@ -1142,13 +1426,11 @@ class GlpiClient:
         Returns:
             dict: {name_lower: id}
         """
+        if self._task_type_map is not None:
+            return self._task_type_map
         endpoint = f"{self.url}/ProjectTaskType"
         try:
-            params = {"range": "0-1000"}
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
-            response.raise_for_status()
-
-            types = response.json()
+            types = self._get_json(endpoint, params={"range": "0-1000"})
             if not types:
                 return {}
 
@@ -1158,10 +1440,11 @@ class GlpiClient:
                 tid = t.get('id')
                 if name and tid:
                     type_map[name.lower()] = tid
+            self._task_type_map = type_map
             return type_map
 
         except Exception as e:
-            print(f"[ERROR] Failed to fetch Project Task Types: {e}")
+            logger.error("[ERROR] Failed to fetch Project Task Types: %s", e)
             return {}
 
     def create_project_state(self, name, color, is_finished=0):
@@ -1175,18 +1458,20 @@ class GlpiClient:
             }
         }
         try:
-            requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            self.session.post(endpoint, data=_dumps(payload))
+            self._state_map = None  # force refetch on next lookup
         except Exception as e:
-            print(f"  [ERROR] Failed to create State '{name}': {e}")
+            logger.error("  [ERROR] Failed to create State '%s': %s", name, e)
 
     def create_project_task_type(self, name):
         """Create a Project Task Type."""
         endpoint = f"{self.url}/ProjectTaskType"
         payload = {"input": {"name": name}}
         try:
-            requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            self.session.post(endpoint, data=_dumps(payload))
+            self._task_type_map = None  # force refetch on next lookup
         except Exception as e:
-            print(f"  [ERROR] Failed to create Type '{name}': {e}")
+            logger.error("  [ERROR] Failed to create Type '%s': %s", name, e)
 
     def create_project_task(self, project_id, name, content, **kwargs):
         """
@@ -1201,7 +1486,7 @@ class GlpiClient:
         Returns:
             int: Task ID or None
         """
-        endpoint = f"{self.url}/ProjectTask"
+        endpoint = self._project_task_url
         payload = {
             "input": {
                 "projects_id": project_id,
@@ -1215,15 +1500,15 @@ class GlpiClient:
             payload['input'].update(kwargs)
 
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             response.raise_for_status()
-            result = response.json()
-            print(f"Created ProjectTask '{name}': ID {result.get('id')}")
+            result = _loads(response.content)
+            logger.info("Created ProjectTask '%s': ID %s", name, result.get('id'))
             return result.get('id')
         except Exception as e:
-            print(f"Failed to create ProjectTask '{name}': {e}")
+            logger.error("Failed to create ProjectTask '%s': %s", name, e)
             if hasattr(e, 'response') and e.response:
-                print(e.response.text)
+                logger.error(e.response.text)
             return None
 
     def update_project_task(self, task_id, **kwargs):
@@ -1240,13 +1525,13 @@ class GlpiClient:
         endpoint = f"{self.url}/ProjectTask/{task_id}"
         payload = {"input": kwargs}
         try:
-            response = requests.put(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.put(endpoint, data=_dumps(payload))
             response.raise_for_status()
             return True
         except Exception as e:
-            print(f"Failed to update ProjectTask {task_id}: {e}")
+            logger.error("Failed to update ProjectTask %s: %s", task_id, e)
             if hasattr(e, 'response') and e.response:
-                print(e.response.text)
+                logger.error(e.response.text)
             return False
 
     def add_project_task_team_member(self, task_id, user_id):
@@ -1269,10 +1554,10 @@ class GlpiClient:
             }
         }
         try:
-            requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            self.session.post(endpoint, data=_dumps(payload))
             return True
         except Exception as e:
-            print(f"  [ERROR] Failed to add User {user_id} to Task {task_id}: {e}")
+            logger.error("  [ERROR] Failed to add User %s to Task %s: %s", user_id, task_id, e)
             return False
 
     def create_note(self, itemtype, items_id, content, **kwargs):
@@ -1303,20 +1588,165 @@ class GlpiClient:
             payload['input'].update(kwargs)
 
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            response = self.session.post(endpoint, data=_dumps(payload))
             if response.status_code >= 400:
-                print(f"[WARN] Note API returned {response.status_code} (GLPI bug - Note likely created anyway)")
+                logger.warning("[WARN] Note API returned %s (GLPI bug - Note likely created anyway)", response.status_code)
             return True
         except Exception as e:
-            print(f"[ERROR] Network error creating Note: {e}")
+            logger.error("[ERROR] Network error creating Note: %s", e)
             return False
 
+    # ===== Bulk Operations =====
+
+    # Inputs per multi-input POST; keeps payloads well under server limits
+    BULK_CHUNK_SIZE = 50
+
+    def create_items_bulk(self, itemtype, inputs):
+        """
+        Create many items of one type in chunked multi-input POSTs.
+
+        GLPI's REST API accepts a list under "input", creating all items
+        in one round-trip; IDs come back in input order. This collapses N
+        per-item POSTs (N round-trips) to ceil(N / BULK_CHUNK_SIZE).
+
+        Args:
+            itemtype: GLPI itemtype (e.g., 'ProjectTask', 'ITILFollowup')
+            inputs: List of input dicts, one per item
+
+        Returns:
+            list: Created IDs aligned with inputs (None where a chunk failed)
+        """
+        endpoint = f"{self.url}/{itemtype}"
+        ids = []
+        for start in range(0, len(inputs), self.BULK_CHUNK_SIZE):
+            chunk = inputs[start:start + self.BULK_CHUNK_SIZE]
+            payload = {"input": chunk}
+            try:
+                response = self.session.post(endpoint, data=_dumps(payload))
+                response.raise_for_status()
+                result = _loads(response.content)
+                # Single-element input lists come back as a bare dict
+                if isinstance(result, dict):
+                    result = [result]
+                ids.extend(entry.get('id') for entry in result)
+            except Exception as e:
+                logger.error("Bulk create of %s %s failed: %s", len(chunk), itemtype, e)
+                if hasattr(e, 'response') and e.response is not None:
+                    logger.error(e.response.text)
+                ids.extend([None] * len(chunk))
+        return ids
+
+    def update_items_bulk(self, itemtype, updates):
+        """
+        Update many items of one type in chunked multi-input PUTs.
+
+        Same multi-input mechanics as create_items_bulk, but each input
+        dict must carry the target "id". GLPI answers one {id: ...,
+        message: ...} row per input, in order.
+
+        Args:
+            itemtype: GLPI itemtype (e.g., 'ProjectTask')
+            updates: List of input dicts, each including 'id'
+
+        Returns:
+            list: Success booleans aligned with updates
+        """
+        endpoint = f"{self.url}/{itemtype}"
+        results = []
+        for start in range(0, len(updates), self.BULK_CHUNK_SIZE):
+            chunk = updates[start:start + self.BULK_CHUNK_SIZE]
+            payload = {"input": chunk}
+            try:
+                response = self.session.put(endpoint, data=_dumps(payload))
+                response.raise_for_status()
+                result = _loads(response.content)
+                if isinstance(result, dict):
+                    result = [result]
+                results.extend(bool(entry.get(str(item['id']), True))
+                               for entry, item in zip(result, chunk))
+            except Exception as e:
+                logger.error("Bulk update of %s %s failed: %s", len(chunk), itemtype, e)
+                if hasattr(e, 'response') and e.response is not None:
+                    logger.error(e.response.text)
+                results.extend([False] * len(chunk))
+        return results
+
+    def create_project_tasks_bulk(self, tasks):
+        """
+        Create many ProjectTasks at once.
+
+        Args:
+            tasks: List of dicts with projects_id/name/content plus any
+                   extra ProjectTask fields
+
+        Returns:
+            list: Task IDs aligned with tasks (None on failure)
+        """
+        inputs = [{"percent_done": 0, **task} for task in tasks]
+        return self.create_items_bulk('ProjectTask', inputs)
+
+    def update_project_tasks_bulk(self, updates):
+        """
+        Update many ProjectTasks at once.
+
+        Args:
+            updates: List of dicts, each with 'id' plus the fields to
+                     change
+
+        Returns:
+            list: Success booleans aligned with updates
+        """
+        return self.update_items_bulk('ProjectTask', list(updates))
+
+    def add_ticket_followups_bulk(self, followups):
+        """
+        Add many ticket followups at once.
+
+        Args:
+            followups: List of dicts with tickets_id and content, plus
+                       optional users_id/is_private/date
+
+        Returns:
+            list: Followup IDs aligned with followups (None on failure)
+        """
+        inputs = []
+        for fu in followups:
+            item = {
+                "items_id": fu['tickets_id'],
+                "itemtype": "Ticket",
+                "content": fu['content'],
+                "is_private": fu.get('is_private', 0)
+            }
+            if fu.get('users_id'):
+                item['users_id'] = fu['users_id']
+            if fu.get('date'):
+                item['date'] = fu['date']
+            inputs.append(item)
+        return self.create_items_bulk('ITILFollowup', inputs)
+
+    def create_notes_bulk(self, notes):
+        """
+        Create many Notepad entries at once.
+
+        Args:
+            notes: List of dicts with itemtype/items_id/content
+
+        Returns:
+            list: Note IDs aligned with notes (None on failure)
+        """
+        return self.create_items_bulk('Notepad', list(notes))
+
     # ===== Document Operations =====
 
     def upload_document(self, file_path, name=None):
         """
         Upload a file to GLPI as a Document.
 
+        The multipart body is streamed from disk in chunks, so peak memory
+        stays constant regardless of attachment size. Identical files
+        (same content hash) are uploaded once and the Document ID reused —
+        shared logos/icons across Confluence pages are common.
+
         Args:
             file_path: Path to file
             name: Document name (default: filename)
@@ -1327,34 +1757,42 @@ class GlpiClient:
         if not name:
             name = os.path.basename(file_path)
 
+        digest = _file_digest(file_path)
+        cached_id = self._doc_cache.get(digest)
+        if cached_id:
+            logger.info("Reusing already-uploaded document for %s (ID %s)", name, cached_id)
+            return cached_id
+
         endpoint = f"{self.url}/Document"
         manifest = {"input": {"name": name, "_filename": [name]}}
-
-        files = {
-            'uploadManifest': (None, json.dumps(manifest), 'application/json'),
-            'filename[0]': (name, open(file_path, 'rb'), mimetypes.guess_type(file_path)[0] or 'application/octet-stream')
-        }
-
-        upload_headers = self.headers.copy()
-        upload_headers.pop("Content-Type", None)
+        mime_type = _guess_mime(os.path.splitext(file_path)[1].lower())
 
         try:
-            response = requests.post(endpoint, headers=upload_headers, files=files, verify=self.verify_ssl)
+            with open(file_path, 'rb') as fh:
+                encoder = MultipartEncoder(fields={
+                    'uploadManifest': (None, _dumps(manifest), 'application/json'),
+                    'filename[0]': (name, fh, mime_type)
+                })
+                # Base headers precomputed once per session; only the
+                # boundary-bearing Content-Type differs per upload.
+                upload_headers = {**self._upload_headers,
+                                  'Content-Type': encoder.content_type}
+                response = self.session.post(endpoint, headers=upload_headers, data=encoder)
             if not response.ok:
-                print(f"Upload failed. Status: {response.status_code}")
-                print(f"Response: {response.text}")
+                logger.error("Upload failed. Status: %s", response.status_code)
+                logger.error("Response: %s", response.text)
             response.raise_for_status()
-            result = response.json()
-            print(f"Uploaded {name}: {result}")
+            result = _loads(response.content)
+            logger.info("Uploaded %s: %s", name, result)
             doc_id = result.get('id')
+            if doc_id:
+                self._doc_cache[digest] = doc_id
             return doc_id
         except Exception as e:
-            print(f"Failed to upload {name}: {e}")
+            logger.error("Failed to upload %s: %s", name, e)
             if hasattr(e, 'response') and e.response:
-                print(e.response.text)
+                logger.error(e.response.text)
             return None
-        finally:
-            files['filename[0]'][1].close()
 
     def link_document_to_ticket(self, ticket_id, doc_id):
         """
@@ -1376,10 +1814,10 @@ class GlpiClient:
             }
         }
         try:
-            requests.post(endpoint, headers=self.headers, json=payload, verify=self.verify_ssl)
+            self.session.post(endpoint, data=_dumps(payload))
             return True
         except Exception as e:
-            print(f"Failed to link doc {doc_id} to ticket {ticket_id}: {e}")
+            logger.error("Failed to link doc %s to ticket %s: %s", doc_id, ticket_id, e)
             return False
 
     def delete_document(self, doc_id):
@@ -1394,12 +1832,12 @@ class GlpiClient:
         """
         endpoint = f"{self.url}/Document/{doc_id}"
         try:
-            response = requests.delete(endpoint, headers=self.headers, params={"force_purge": "true"}, verify=self.verify_ssl)
+            response = self.session.delete(endpoint, params={"force_purge": "true"})
             response.raise_for_status()
-            print(f"Deleted Document ID: {doc_id}")
+            logger.info("Deleted Document ID: %s", doc_id)
             return True
         except Exception as e:
-            print(f"Failed to delete document {doc_id}: {e}")
+            logger.error("Failed to delete document %s: %s", doc_id, e)
             return False
 
     # ===== Asset/Item Search =====
@@ -1433,11 +1871,11 @@ class GlpiClient:
         }
 
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             if response.status_code != 200:
                 return None
 
-            result = response.json()
+            result = _loads(response.content)
             data = result.get('data', [])
 
             for item in data:
@@ -1464,11 +1902,11 @@ class GlpiClient:
         """
         endpoint = f"{self.url}/{item_type}/{item_id}"
         try:
-            response = requests.get(endpoint, headers=self.headers, verify=self.verify_ssl)
+            response = self.session.get(endpoint)
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except Exception as e:
-            print(f"Failed to get {item_type} {item_id}: {e}")
+            logger.error("Failed to get %s %s: %s", item_type, item_id, e)
             return None
 
     # ===== Utilities =====
@@ -1483,24 +1921,24 @@ class GlpiClient:
         endpoint = f"{self.url}/{endpoint_suffix}"
         try:
             params = {"range": "0-1000"}
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params)
             if response.status_code != 200:
                 return
 
-            items = response.json()
+            items = _loads(response.content)
             if not items:
                 return
 
-            print(f"  > Deleting {len(items)} items from {endpoint_suffix}...")
+            logger.info("  > Deleting %s items from %s...", len(items), endpoint_suffix)
             count = 0
             for item in items:
                 try:
                     del_url = f"{endpoint}/{item['id']}"
-                    requests.delete(del_url, headers=self.headers, params={"force_purge": "true"}, verify=self.verify_ssl)
+                    self.session.delete(del_url, params={"force_purge": "true"})
                     count += 1
                 except:
                     pass
-            print(f"  > Deleted {count} items.")
+            logger.info("  > Deleted %s items.", count)
 
         except Exception as e:
-            print(f"  > Error clearing {endpoint_suffix}: {e}")
+            logger.error("  > Error clearing %s: %s", endpoint_suffix, e)
@@ -3,7 +3,29 @@ Unified Jira REST API Client
 Consolidates functionality from folders 02 and 03
 Supports: Issue search, Attachments, Project metadata, Security levels
 """
+from concurrent.futures import ThreadPoolExecutor
+
+import json
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: 2-5x faster JSON than stdlib
+except ImportError:
+    orjson = None
+
+# Connect/read timeout for all Jira calls; search responses with
+# changelog expanded can be slow to first byte.
+REQUEST_TIMEOUT = (5, 60)
+
+
+def _loads(raw):
+    """Parse JSON bytes/str, via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class JiraClient:
@@ -35,9 +57,59 @@ class JiraClient:
             "Accept": "application/json"
         }
 
+        # One pooled session for all calls: keep-alive amortizes the
+        # TCP + TLS handshake, the pool is wide enough for the parallel
+        # page fetches, and transient 429/5xx retry with backoff.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Rate-limited responses carry Retry-After; sleep what the
+                # server asks rather than the exponential schedule.
+                respect_retry_after_header=True,
+                # POST included: the only POST is the idempotent
+                # approximate-count probe.
+                allowed_methods=frozenset(['GET', 'POST'])
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+        self.session.verify = self.verify_ssl
+
     # ===== Issue Search =====
 
-    def search_issues(self, jql, start_at=0, max_results=50):
+    def _search(self, jql, start_at, max_results, fields=None, expand=None):
+        """
+        One GET against /rest/api/2/search; returns the parsed payload.
+        Only sends fields/expand when asked — the server skips the field
+        expansion work entirely for callers that don't need it.
+        """
+        endpoint = f"{self.url}/rest/api/2/search"
+        params = {
+            "jql": jql,
+            "startAt": start_at,
+            "maxResults": max_results
+        }
+        if fields is not None:
+            params["fields"] = fields
+        if expand is not None:
+            params["expand"] = expand
+
+        response = self.session.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            print(f"Jira API Error ({response.status_code}): {response.text}")
+            response.raise_for_status()
+        # Search payloads with changelog expanded run to hundreds of KB;
+        # parse the raw bytes with the fast path.
+        return _loads(response.content)
+
+    def search_issues(self, jql, start_at=0, max_results=50, fields=None,
+                      expand="changelog"):
         """
         Search issues using JQL with pagination.
 
@@ -45,36 +117,52 @@ class JiraClient:
             jql: JQL query string
             start_at: Pagination offset (default: 0)
             max_results: Maximum results per page (default: 50)
+            fields: Field list to return (default: all fields); narrowing
+                this cuts Jira-side serialization and payload size
+            expand: Expansions to request (default: "changelog")
 
         Returns:
             tuple: (issues_list, total_count)
         """
-        endpoint = f"{self.url}/rest/api/2/search"
-
-        params = {
-            "jql": jql,
-            "startAt": start_at,
-            "maxResults": max_results,
-            "fields": ["*all"],
-            "expand": "changelog"
-        }
-
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            data = self._search(jql, start_at, max_results,
+                                fields=fields if fields is not None else ["*all"],
+                                expand=expand)
+            return data.get("issues", []), data.get("total", 0)
+        except Exception as e:
+            print(f"Failed to fetch issues: {e}")
+            raise
 
-            if response.status_code != 200:
-                print(f"Jira API Error ({response.status_code}): {response.text}")
-                response.raise_for_status()
+    def search_issues_all(self, jql, page_size=100, concurrency=8):
+        """
+        Fetch every page of a JQL search, pages in parallel.
 
-            data = response.json()
-            issues = data.get("issues", [])
-            total = data.get("total", 0)
+        A zero-row probe learns the total, then the startAt offsets fan
+        out over a thread pool; each page is an independent GET, so the
+        wall clock collapses from total/page_size round-trips to roughly
+        total/page_size/concurrency.
 
-            return issues, total
+        Args:
+            jql: JQL query string
+            page_size: Results per page (default: 100)
+            concurrency: Parallel page fetches (default: 8)
 
-        except Exception as e:
-            print(f"Failed to fetch issues: {e}")
-            raise
+        Returns:
+            tuple: (issues_list in startAt order, total_count)
+        """
+        _, total = self.search_issues(jql, start_at=0, max_results=0)
+        if not total:
+            return [], 0
+
+        issues = []
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pages = pool.map(
+                lambda offset: self.search_issues(jql, offset, page_size)[0],
+                range(0, total, page_size)
+            )
+            for page in pages:
+                issues.extend(page)
+        return issues, total
 
     def search_issues_lightweight(self, jql, fields=None, start_at=0, max_results=50):
         """
@@ -92,27 +180,9 @@ class JiraClient:
         if fields is None:
             fields = ["assignee", "reporter"]
 
-        endpoint = f"{self.url}/rest/api/2/search"
-        params = {
-            "jql": jql,
-            "startAt": start_at,
-            "maxResults": max_results,
-            "fields": fields
-        }
-
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
-
-            if response.status_code != 200:
-                print(f"Jira API Error ({response.status_code}): {response.text}")
-                response.raise_for_status()
-
-            data = response.json()
-            issues = data.get("issues", [])
-            total = data.get("total", 0)
-
-            return issues, total
-
+            data = self._search(jql, start_at, max_results, fields=fields)
+            return data.get("issues", []), data.get("total", 0)
         except Exception as e:
             print(f"Failed to fetch issues: {e}")
             raise
@@ -127,19 +197,20 @@ class JiraClient:
         Returns:
             int: Total issue count
         """
-        endpoint = f"{self.url}/rest/api/2/search"
-        params = {
-            "jql": jql,
-            "startAt": 0,
-            "maxResults": 0,
-            "fields": ["key"]  # minimal field to reduce payload
-        }
+        # Newer Jira versions expose a count-only endpoint that skips
+        # result building entirely; absent (404) on older servers.
+        endpoint = f"{self.url}/rest/api/2/search/approximate-count"
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
-            if response.status_code != 200:
-                print(f"Jira Count Error ({response.status_code}): {response.text[:500]}")
-                response.raise_for_status()
-            data = response.json()
+            response = self.session.post(endpoint, json={"jql": jql},
+                                         timeout=REQUEST_TIMEOUT)
+            if response.status_code == 200:
+                return _loads(response.content).get("count", 0)
+        except Exception:
+            pass
+
+        try:
+            # maxResults=0 with one cheap field and no changelog expand
+            data = self._search(jql, 0, 0, fields=["summary"])
             return data.get("total", 0)
         except Exception as e:
             print(f"Failed to get issue count: {e}")
@@ -160,7 +231,7 @@ class JiraClient:
         endpoint = f"{self.url}/rest/api/2/user"
         params = {"username": username}
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             if response.status_code == 404:
                 return None
             response.raise_for_status()
@@ -170,23 +241,33 @@ class JiraClient:
 
     # ===== Attachments =====
 
-    def get_attachment_content(self, download_url):
+    def get_attachment_content(self, download_url, dest_path=None, chunk_size=1 << 16):
         """
-        Download attachment content.
+        Download attachment content, streamed in fixed-size chunks.
 
         Args:
             download_url: Attachment download URL
+            dest_path: Write the body straight to this path instead of
+                       buffering it in memory (optional)
+            chunk_size: Streaming chunk size in bytes (default: 64 KiB)
 
         Returns:
-            bytes: Attachment content or None
+            dest_path when given, else bytes; None on failure
         """
         try:
-            response = requests.get(download_url, headers=self.headers, verify=self.verify_ssl, stream=True)
-            if response.status_code == 200:
-                return response.content
-            else:
-                print(f"Failed to download attachment: Status {response.status_code}")
-                return None
+            with self.session.get(download_url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                if response.status_code != 200:
+                    print(f"Failed to download attachment: Status {response.status_code}")
+                    return None
+                if dest_path:
+                    with open(dest_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            f.write(chunk)
+                    return dest_path
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    buf.extend(chunk)
+                return bytes(buf)
         except Exception as e:
             print(f"Error downloading attachment: {e}")
             return None
@@ -205,7 +286,7 @@ class JiraClient:
         """
         endpoint = f"{self.url}/rest/api/2/project/{project_key}/statuses"
         try:
-            response = requests.get(endpoint, headers=self.headers, verify=self.verify_ssl)
+            response = self.session.get(endpoint, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
 
@@ -242,7 +323,7 @@ class JiraClient:
         """
         endpoint = f"{self.url}/rest/api/2/project/{project_key}"
         try:
-            response = requests.get(endpoint, headers=self.headers, verify=self.verify_ssl)
+            response = self.session.get(endpoint, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             return data.get('issueTypes', [])
@@ -264,7 +345,7 @@ class JiraClient:
         endpoint = f"{self.url}/rest/api/2/user/assignable/search"
         params = {"project": project_key, "maxResults": 1000}
         try:
-            response = requests.get(endpoint, headers=self.headers, params=params, verify=self.verify_ssl)
+            response = self.session.get(endpoint, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -292,7 +373,7 @@ class JiraClient:
         # --- Method 1: Direct API ---
         endpoint = f"{self.url}/rest/api/2/project/{project_key}/securitylevel"
         try:
-            response = requests.get(endpoint, headers=self.headers, verify=self.verify_ssl)
+            response = self.session.get(endpoint, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             levels = data.get('levels', [])
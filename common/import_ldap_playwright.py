@@ -8,8 +8,13 @@ if _script_dir in sys.path:
     sys.path.remove(_script_dir)
 sys.path.insert(0, os.path.abspath(os.path.join(_script_dir, '..')))
 
+import re
+import json
 import time
 import getpass
+import functools
+import threading
+import requests
 from playwright.sync_api import sync_playwright
 from common.config.loader import load_config
 
@@ -26,6 +31,220 @@ LOGIN_URL = f"{GLPI_URL}/front/login.php"
 BATCH_SIZE = 3
 MAX_BATCHES = 1
 
+# Selectors reused every batch; built once instead of re-allocated (and
+# re-parsed by Playwright) ~95 times per run
+LDAP_CHECKBOX_SEL = 'input[name^="item[AuthLDAP]"]'
+SEARCH_BTN_SEL = (
+    'button[name="search"]:visible, '
+    'input[type="submit"][name="search"]:visible, '
+    'button[type="submit"]:has-text("Search"):visible, '
+    'button[type="submit"]:has-text("Tìm kiếm"):visible, '
+    '.card-footer .btn-primary:visible'
+)
+ACTION_BTN_SEL = '.massiveaction-button:visible, button[title="Actions"]:visible'
+RESULT_READY_SEL = LDAP_CHECKBOX_SEL + ', .alert-success, .alert-info'
+
+# Import cursor: lets a crashed run resume at O(remaining) instead of
+# redoing every batch from zero. Lives next to the script.
+STATE_FILE = os.path.join(_script_dir, 'state.json')
+
+
+def _load_state():
+    try:
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state):
+    # Write-then-rename so a crash mid-write never corrupts the cursor
+    tmp_path = STATE_FILE + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def with_retry(attempts=3, initial_delay=2.0, max_delay=10.0):
+    """
+    Retry decorator with exponential backoff; re-raises the last error.
+    Keeps call sites straight-line instead of inlined retry ladders.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            delay = initial_delay
+            for attempt in range(1, attempts + 1):
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    if attempt == attempts:
+                        raise
+                    print(f"{fn.__name__} failed (attempt {attempt}/{attempts}): {e}")
+                    time.sleep(delay)
+                    delay = min(delay * 2, max_delay)
+        return wrapper
+    return decorate
+
+
+class GlpiLdapImporter:
+    """
+    Browser-free LDAP import: log in once over plain HTTP and drive the
+    same massive-action form POSTs the browser would. Skips the per-click
+    Playwright auto-wait and the full page reload per batch entirely.
+    """
+
+    CSRF_RE = re.compile(r'name="_glpi_csrf_token"\s+value="([^"]+)"')
+    GUID_RE = re.compile(r'name="item\[AuthLDAP\]\[([^"]+)\]"')
+
+    def __init__(self, username, password):
+        self.username = username
+        self.password = password
+        self.session = requests.Session()
+        self.session.verify = False
+
+    def _csrf_token(self, html):
+        m = self.CSRF_RE.search(html)
+        return m.group(1) if m else None
+
+    def login(self):
+        """GET the login form for a CSRF token, then POST credentials."""
+        print(f"Logging in via HTTP: {LOGIN_URL}")
+        resp = self.session.get(LOGIN_URL, timeout=60)
+        token = self._csrf_token(resp.text)
+        if not token:
+            print("Could not find CSRF token on login page.")
+            return False
+
+        resp = self.session.post(
+            f"{GLPI_URL}/front/login.php",
+            data={
+                "login_name": self.username,
+                "login_password": self.password,
+                "_glpi_csrf_token": token,
+                "submit": "submit",
+            },
+            timeout=60,
+        )
+        if "login.php" in resp.url:
+            print("Login failed. Please check credentials.")
+            return False
+        print("Login successful.")
+        return True
+
+    def fetch_guids(self):
+        """Run the LDAP search and return the importable user GUIDs."""
+        resp = self.session.get(
+            LDAP_IMPORT_URL, params={"action": "search"}, timeout=120
+        )
+        return self.GUID_RE.findall(resp.text)
+
+    def import_batch(self, guids, page_html=None):
+        """Submit one massive-action import for the given GUIDs."""
+        if page_html is None:
+            page_html = self.session.get(LDAP_IMPORT_URL, timeout=60).text
+        token = self._csrf_token(page_html)
+
+        data = {
+            "massiveaction": "AuthLDAP:import",
+            "action": "AuthLDAP:import",
+            "itemtype": "AuthLDAP",
+            "is_deleted": 0,
+        }
+        if token:
+            data["_glpi_csrf_token"] = token
+        for guid in guids:
+            data[f"item[AuthLDAP][{guid}]"] = "on"
+
+        resp = self.session.post(
+            f"{GLPI_URL}/front/massiveaction.php", data=data, timeout=300
+        )
+        return resp.ok
+
+    def run(self, batch_size=BATCH_SIZE, max_batches=MAX_BATCHES):
+        """Login + batch loop. Returns number of users submitted."""
+        if not self.login():
+            return 0
+
+        total_imported = 0
+        batch_count = 0
+        while True:
+            if max_batches > 0 and batch_count >= max_batches:
+                print(f"Stopping before batch {batch_count+1} (Limit: {max_batches}).")
+                break
+            batch_count += 1
+            print(f"\n--- Starting Batch {batch_count} (HTTP) ---")
+
+            guids = self.fetch_guids()
+            print(f"Found {len(guids)} users on this page.")
+            if not guids:
+                print("No more users found to import. Process complete!")
+                break
+
+            batch = guids[:batch_size]
+            if self.import_batch(batch):
+                total_imported += len(batch)
+                print(f"Imported batch of {len(batch)} users (Total: {total_imported}).")
+            else:
+                print("Import POST failed. Stopping.")
+                break
+        return total_imported
+
+
+def run_http():
+    """Browser-free entry point (see GlpiLdapImporter)."""
+    username = _glpi.get('username', None) or input("GLPI Username: ")
+    password = _glpi.get('password', None) or getpass.getpass("GLPI Password: ")
+    importer = GlpiLdapImporter(username, password)
+    total = importer.run()
+    print(f"Done. {total} users submitted for import.")
+
+
+def run_http_parallel(workers=4, batch_size=BATCH_SIZE, max_batches=MAX_BATCHES):
+    """
+    Fan the HTTP import out over several concurrent GLPI sessions.
+
+    Each worker logs in on its own cookie jar (its own server session)
+    and runs the search/import loop; workers start on staggered slices
+    of the result list so they rarely pick the same users, and GLPI
+    treats a re-import of an already-imported user as an update, so the
+    occasional overlap is harmless. Throughput scales until GLPI's LDAP
+    backend saturates.
+    """
+    username = _glpi.get('username', None) or input("GLPI Username: ")
+    password = _glpi.get('password', None) or getpass.getpass("GLPI Password: ")
+
+    total = [0]
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        importer = GlpiLdapImporter(username, password)
+        if not importer.login():
+            return
+        batches = 0
+        while True:
+            if max_batches > 0 and batches >= max_batches:
+                break
+            batches += 1
+            guids = importer.fetch_guids()
+            if not guids:
+                break
+            offset = (worker_id * batch_size) % len(guids)
+            batch = (guids[offset:] + guids[:offset])[:batch_size]
+            if not importer.import_batch(batch):
+                print(f"[worker {worker_id}] Import POST failed. Stopping.")
+                break
+            with lock:
+                total[0] += len(batch)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(f"Done. {total[0]} users submitted for import across {workers} workers.")
+
+
 def run():
     print("GLPI LDAP Import Automation (Playwright)")
     print("----------------------------------------")
@@ -50,13 +269,56 @@ def run():
     
     with sync_playwright() as p:
         print("Launching browser...")
-        # headless=False so you can see what's happening
-        # no delay fast click
-        browser = p.chromium.launch(headless=False)
+        # Headless by default: nobody watches the window and the
+        # compositor/paint work is pure overhead. Set DEBUG_HEADFUL=1 to
+        # watch a run while debugging.
+        headful = os.environ.get("DEBUG_HEADFUL") == "1"
+        browser = p.chromium.launch(
+            headless=not headful,
+            args=[
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
+                "--no-sandbox",
+                "--disable-extensions",
+                "--disable-background-networking",
+                "--disable-sync",
+                "--metrics-recording-only",
+                "--mute-audio",
+            ],
+        )
         # Ignore SSL errors for internal domains
         context = browser.new_context(ignore_https_errors=True)
+
+        # The script never looks at the page, so skip the asset bundle:
+        # blocking images/fonts/styles cuts most bytes per page.goto and
+        # lets domcontentloaded fire sooner. Form POSTs are unaffected.
+        def _block_assets(route):
+            if route.request.resource_type in {"image", "font", "stylesheet", "media"}:
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route("**/*", _block_assets)
+        context.route(re.compile(r"(google-analytics|matomo|piwik|gstatic)"),
+                      lambda route: route.abort())
+
         page = context.new_page()
-        
+
+        # Keep Chromium's HTTP cache warm across the 95 renavigations:
+        # Playwright disables it by default, so every batch re-downloaded
+        # cache-eligible JS. Also make sure no throttling/service worker
+        # sits between us and the server.
+        try:
+            cdp = context.new_cdp_session(page)
+            cdp.send("Network.setCacheDisabled", {"cacheDisabled": False})
+            cdp.send("Network.setBypassServiceWorker", {"bypass": True})
+            cdp.send("Network.emulateNetworkConditions", {
+                "offline": False, "latency": 0,
+                "downloadThroughput": -1, "uploadThroughput": -1,
+            })
+        except Exception as e:
+            print(f"CDP cache tuning unavailable: {e}")
+
         # 1. Login
         print(f"Navigating to {LOGIN_URL}...")
         try:
@@ -84,16 +346,36 @@ def run():
         except Exception as e:
              print(f"Wait for login timed out: {e}. Checking if logged in...")
 
-        if "login.php" in page.url and "error" in page.content():
+        # Cheap locator count instead of serializing the whole DOM over
+        # CDP just to substring-match "error" (and the substring broke on
+        # translated error messages anyway)
+        if "login.php" in page.url and \
+                page.locator('.alert-danger, .error, [role="alert"]').count() > 0:
             print("Login failed. Please check credentials.")
             return
 
         print("Login probably successful.")
         
-        total_imported = 0
+        # Resume from the persisted cursor if a previous run died partway
+        state = _load_state()
+        total_imported = int(state.get('total_imported', 0))
+        pending_guids = state.get('pending_guids') or []
+        if total_imported or pending_guids:
+            print(f"Resuming: {total_imported} users already processed"
+                  f" ({len(pending_guids)} in flight at last crash).")
         # Loop through pages/batches
         batch_count = 0
-        
+
+        @with_retry(attempts=3, initial_delay=2.0, max_delay=10.0)
+        def nav_to_import():
+            # 'commit' returns as soon as the navigation is committed;
+            # 'domcontentloaded' still waits out GLPI's large legacy
+            # template parse. We only need the form controls, so wait
+            # for those explicitly instead.
+            page.goto(LDAP_IMPORT_URL, timeout=60000, wait_until='commit')
+            page.wait_for_selector(LDAP_CHECKBOX_SEL + ', button[name="search"]',
+                                   state='attached', timeout=30000)
+
         while True:
             if MAX_BATCHES > 0 and batch_count >= MAX_BATCHES:
                 print(f"Debug Mode: Stopping before starting batch {batch_count+1} (Limit: {MAX_BATCHES}).")
@@ -103,104 +385,139 @@ def run():
             print(f"\n--- Starting Batch {batch_count} ---")
             # 2. Go to Import Page manually and click search
             # Navigating directly with params might cause session redirect issues
-            
-            print(f"Navigating to base import page...")
-            
-            # --- Retry logic for initial navigation ---
-            max_nav_retries = 3
-            nav_success = False
-            for retry in range(max_nav_retries):
+
+            # The massive-action submit already lands back on the results
+            # page; if the next batch's checkboxes are present, skip the
+            # goto + Search round-trip entirely.
+            if ("ldap.import.php" in str(page.url)
+                    and page.locator(LDAP_CHECKBOX_SEL).count() > 0):
+                print("Results already on page; skipping navigation.")
+                nav_success = True
+            else:
+                print(f"Navigating to base import page...")
                 try:
-                    page.goto(LDAP_IMPORT_URL, timeout=60000, wait_until='domcontentloaded')
+                    nav_to_import()
                     nav_success = True
-                    break
                 except Exception as e:
-                    print(f"Navigation error (Attempt {retry+1}/{max_nav_retries}): {e}")
-                    time.sleep(5)
-            
+                    print(f"Navigation failed after retries: {e}")
+                    nav_success = False
+
             if not nav_success:
                 print("Failed to navigate to import page after retries. Retrying batch...")
-                time.sleep(10)
+                try:
+                    page.wait_for_load_state('domcontentloaded', timeout=30000)
+                except Exception:
+                    pass
                 continue
 
             # Verify we are on the correct page (or at least not an error page)
             # Simple approach: Check if we are on the form
             if "ldap.import.php" in str(page.url):
-                 print("Import page confirmed. Looking for Search button...")
-                 
-                 # Try multiple search button locators
-                 search_btn = page.locator('button[name="search"]') # Standard GLPI
-                 if not search_btn.is_visible():
-                     search_btn = page.locator('input[type="submit"][name="search"]')
-                 if not search_btn.is_visible():
-                     search_btn = page.locator('button[type="submit"]').filter(has_text="Search")
-                 if not search_btn.is_visible():
-                     search_btn = page.locator('button[type="submit"]').filter(has_text="Tìm kiếm") # Vietnamese
-                 if not search_btn.is_visible():
-                     search_btn = page.locator('.card-footer .btn-primary').first # GLPI 10 Common
-                 # Fallback: Just the word "Search" anywhere
-                 if not search_btn.is_visible():
-                     search_btn = page.get_by_role("button", name="Search")
-
-                 if search_btn.is_visible():
-                     print("Search button found. Clicking...")
-                     search_btn.click()
-                     # Wait for results
+                 # Only click Search when results are not already showing
+                 if page.locator(LDAP_CHECKBOX_SEL).count() == 0:
+                     print("Import page confirmed. Looking for Search button...")
+
+                     # One union locator instead of six serial is_visible()
+                     # probes: each probe is its own CDP round-trip, the
+                     # first-match wait is a single one.
+                     search_btn = page.locator(SEARCH_BTN_SEL).first
                      try:
-                        page.wait_for_load_state('domcontentloaded', timeout=60000)
-                     except: 
-                        pass
-                 else:
-                     print("CRITICAL: Search button NOT found! Is page fully loaded?")
+                         search_btn.wait_for(state="visible", timeout=10000)
+                         print("Search button found. Clicking...")
+                         search_btn.click()
+                         # Wait for results
+                         try:
+                            page.wait_for_load_state('domcontentloaded', timeout=60000)
+                         except:
+                            pass
+                     except Exception:
+                         print("CRITICAL: Search button NOT found! Is page fully loaded?")
             else:
                  print(f"Warning: Not on ldap.import.php (Current URL: {page.url}). Checking for server selection...")
                  pass
             
             # 3. Check for users
-            # The checkbox name pattern is item[AuthLDAP][GUID]
-            checkboxes = page.locator('input[name^="item[AuthLDAP]"]').all()
-            count = len(checkboxes)
+            # The checkbox name pattern is item[AuthLDAP][GUID].
+            # count() is one integer over CDP; .all() shipped an
+            # ElementHandle per user just to take the length.
+            count = page.locator(LDAP_CHECKBOX_SEL).count()
             print(f"Found {count} users on this page.")
             
             if count == 0:
                 # Double check to ensure we didn't miss loading
                 if "ldap.import.php" not in page.url:
                      print(f"Warning: Count is 0 but URL is strange ({page.url}). Might be an error page. Retrying batch...")
-                     time.sleep(5)
+                     try:
+                         page.wait_for_load_state('domcontentloaded', timeout=30000)
+                     except Exception:
+                         pass
                      continue
                 
                 print("No more users found to import. Process complete!")
                 break
-            
+
+            # Fast-path resume: if the GUIDs that were in flight when the
+            # last run died are gone from the list, their batch committed
+            # server-side — count them and move on without re-importing.
+            if pending_guids:
+                still_listed = page.evaluate(
+                    """(guids) => guids.filter(
+                        g => document.querySelector(`input[name="item[AuthLDAP][${g}]"]`)
+                    ).length""",
+                    pending_guids,
+                )
+                if still_listed == 0:
+                    total_imported += len(pending_guids)
+                    print(f"Last crashed batch of {len(pending_guids)} was "
+                          f"already committed; total now {total_imported}.")
+                else:
+                    print(f"Last crashed batch was not committed "
+                          f"({still_listed} users still listed); re-importing.")
+                pending_guids = []
+                _save_state({'total_imported': total_imported,
+                             'pending_guids': []})
+
             # 4. Select Users (Limit to 3)
-            # The checkbox name pattern is item[AuthLDAP][GUID]
-            checkboxes = page.locator('input[name^="item[AuthLDAP]"]').all()
-            count = len(checkboxes)
-            print(f"Found {count} users on this page.")
-            
-            if count == 0:
-                print("No more users found to import. Process complete!")
-                break
-            
-            # Limit selection to BATCH_SIZE
-            to_select = checkboxes[:BATCH_SIZE]
-            print(f"Selecting {len(to_select)} users...")
-            for cb in to_select:
-                if not cb.is_checked():
-                    cb.check()
+            # Limit selection to BATCH_SIZE. One JS eval checks the whole
+            # batch in-page; the old loop paid two CDP round-trips
+            # (is_checked + check) per checkbox.
+            batch = page.evaluate(
+                """(n) => {
+                    const els = document.querySelectorAll('input[name^="item[AuthLDAP]"]');
+                    const limit = Math.min(n, els.length);
+                    const guids = [];
+                    for (let i = 0; i < limit; i++) {
+                        if (!els[i].checked) {
+                            els[i].checked = true;
+                            els[i].dispatchEvent(new Event('change', {bubbles: true}));
+                        }
+                        guids.push(els[i].name.slice('item[AuthLDAP]['.length, -1));
+                    }
+                    return guids;
+                }""",
+                BATCH_SIZE,
+            )
+            selected = len(batch)
+            print(f"Selecting {selected} users...")
+
+            # Checkpoint the in-flight GUIDs before submitting so a crash
+            # between submit and confirmation is recoverable on restart
+            _save_state({'total_imported': total_imported,
+                         'pending_guids': batch})
             
             # 5. Perform Import Action
             # Click "Actions" button to reveal massive action
             print("Clicking 'Actions' button...")
             
-            # Try multiple selectors for "Actions" button
-            action_btn = page.locator('.massiveaction-button').first
-            if not action_btn.is_visible():
-               action_btn = page.get_by_role("button", name="Actions").first
-            if not action_btn.is_visible():
-               action_btn = page.locator('button[title="Actions"]').first
-            
-            if action_btn.is_visible():
+            # Single union locator instead of three serial probes
+            action_btn = page.locator(ACTION_BTN_SEL).first
+            try:
+                action_btn.wait_for(state="visible", timeout=10000)
+                action_visible = True
+            except Exception:
+                action_visible = False
+
+            if action_visible:
                 action_btn.click()
                 
                 # Wait for "Action" dropdown/modal to appear
@@ -246,7 +563,7 @@ def run():
                     if post_btn.is_visible():
                         print(f"Found Submit button: {post_btn.inner_text() if post_btn.count()>0 else 'Input'}. Clicking...")
                         try:
-                            with page.expect_navigation(timeout=60000, wait_until='domcontentloaded'):
+                            with page.expect_navigation(timeout=60000, wait_until='commit'):
                                 post_btn.click()
                             print("Submit successful, page reloaded.")
                         except Exception as e:
@@ -259,7 +576,7 @@ def run():
                         print("Trying specific selector...")
                         post_btn = page.locator('button[name="massiveaction"][type="submit"]')
                         try:
-                           with page.expect_navigation(timeout=60000, wait_until='domcontentloaded'):
+                           with page.expect_navigation(timeout=60000, wait_until='commit'):
                                 post_btn.click()
                            print("Clicked Submit button.")
                         except Exception as e:
@@ -278,12 +595,22 @@ def run():
             # 6. Wait for processing (Redundant if expect_navigation used, but kept for safety)
             # print("Waiting for import to complete...")
             
-            total_imported += count
-            print(f"Imported batch of {len(to_select)} users (Total processed: {total_imported}).")
-            
-            # Small pause to be safe
-            time.sleep(2)
+            # Only the selected (checked) users went into the massive
+            # action; the page may list more than BATCH_SIZE
+            total_imported += selected
+            print(f"Imported batch of {selected} users (Total processed: {total_imported}).")
+            # Batch committed: clear the in-flight GUIDs from the cursor
+            _save_state({'total_imported': total_imported,
+                         'pending_guids': []})
             
+            # Deterministic wait for the next batch (or a result banner)
+            # instead of a flat 2s pause: a ready server continues at once
+            try:
+                page.wait_for_selector(RESULT_READY_SEL,
+                                       state='attached', timeout=30000)
+            except Exception:
+                pass
+
             # Loop continues, re-loading the page and searching again
             
         print("Done.")
@@ -293,4 +620,12 @@ def run():
             pass
 
 if __name__ == "__main__":
-    run()
+    # --http: direct POST client (fast path); --parallel adds concurrent
+    # sessions on top. Default keeps the browser flow, which copes with
+    # GLPI themes the regexes have not seen.
+    if "--parallel" in sys.argv:
+        run_http_parallel()
+    elif "--http" in sys.argv:
+        run_http()
+    else:
+        run()
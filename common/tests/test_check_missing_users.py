@@ -3,6 +3,7 @@ Unit and integration tests for check_missing_users module.
 Tests user collection from Jira, GLPI comparison, AD status checking,
 LDAP config fetching, report generation, and CLI main flow.
 """
+import json
 import unittest
 import os
 import sys
@@ -691,17 +692,17 @@ class TestSaveDetailedReport(unittest.TestCase):
 class TestSearchIssuesLightweight(unittest.TestCase):
     """Test JiraClient.search_issues_lightweight method."""
 
-    @patch('common.clients.jira_client.requests.get')
+    @patch('common.clients.jira_client.requests.Session.get')
     def test_lightweight_search_default_fields(self, mock_get):
         """Test lightweight search uses assignee+reporter by default."""
         from common.clients.jira_client import JiraClient
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'total': 1,
             'issues': [{'key': 'T-1', 'fields': {'assignee': None, 'reporter': None}}]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         client = JiraClient(url='https://jira.test.com', token='tok')
@@ -715,14 +716,14 @@ class TestSearchIssuesLightweight(unittest.TestCase):
         self.assertEqual(params['fields'], ['assignee', 'reporter'])
         self.assertNotIn('expand', params)
 
-    @patch('common.clients.jira_client.requests.get')
+    @patch('common.clients.jira_client.requests.Session.get')
     def test_lightweight_search_custom_fields(self, mock_get):
         """Test lightweight search with custom fields list."""
         from common.clients.jira_client import JiraClient
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'total': 0, 'issues': []}
+        mock_response.content = json.dumps({'total': 0, 'issues': []}).encode()
         mock_get.return_value = mock_response
 
         client = JiraClient(url='https://jira.test.com', token='tok')
@@ -739,7 +740,7 @@ class TestSearchIssuesLightweight(unittest.TestCase):
         self.assertEqual(params['startAt'], 10)
         self.assertEqual(params['maxResults'], 25)
 
-    @patch('common.clients.jira_client.requests.get')
+    @patch('common.clients.jira_client.requests.Session.get')
     def test_lightweight_search_api_error(self, mock_get):
         """Test lightweight search raises on API error."""
         from common.clients.jira_client import JiraClient
@@ -759,7 +760,7 @@ class TestSearchIssuesLightweight(unittest.TestCase):
 class TestGetUser(unittest.TestCase):
     """Test JiraClient.get_user method."""
 
-    @patch('common.clients.jira_client.requests.get')
+    @patch('common.clients.jira_client.requests.Session.get')
     def test_get_user_success(self, mock_get):
         """Test successful user fetch returns user dict."""
         from common.clients.jira_client import JiraClient
@@ -780,7 +781,7 @@ class TestGetUser(unittest.TestCase):
         self.assertEqual(result['key'], 'abc')
         self.assertEqual(result['name'], '1234567890')
 
-    @patch('common.clients.jira_client.requests.get')
+    @patch('common.clients.jira_client.requests.Session.get')
     def test_get_user_not_found(self, mock_get):
         """Test user not found returns None."""
         from common.clients.jira_client import JiraClient
@@ -794,7 +795,7 @@ class TestGetUser(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch('common.clients.jira_client.requests.get')
+    @patch('common.clients.jira_client.requests.Session.get')
     def test_get_user_exception(self, mock_get):
         """Test exception during fetch returns None."""
         from common.clients.jira_client import JiraClient